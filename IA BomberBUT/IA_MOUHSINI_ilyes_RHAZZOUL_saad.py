@@ -1,4 +1,14 @@
 import random
+from chemins import plus_court_chemin, plus_proche
+from distances import CacheDistances
+from danger import INFINI, carte_danger, fuite
+
+# Cases que le Bomber ne peut pas traverser, comme dans le moteur du jeu : colonnes,
+# murs, bombes et prises. Les fantômes ('F') et les explosions ('X') n'y sont pas : ils
+# bougent ou disparaissent à chaque tour, et les compter obligerait à corriger tous les
+# champs de distances à chaque tour. Un pas vers un fantôme est simplement refusé par
+# le jeu, et l'IA réessaie au tour suivant.
+BLOQUANTES = 'CMBE'
 
 class IA_Bomber:
     def __init__(self, num_joueur: int, game_dic: dict, timerglobal: int, timerfantôme: int) -> None:
@@ -18,9 +28,11 @@ class IA_Bomber:
         self.positions_visitees = set()
         self.derniere_bombe = None
         self.compteur_blocage = 0
+        self.cible = None  # Minerai visé, gardé d'un tour à l'autre
+        self.distances = None  # Cache des champs de distances (créé au premier tour)
 
     def trouver_chemin(self, debut: tuple, fin: tuple, carte: list) -> list:
-        """Trouve le plus court chemin entre deux points en utilisant BFS.
+        """Trouve le plus court chemin entre deux points en utilisant BFS (voir chemins.py).
         
         Args:
             debut (tuple): Position de départ (x, y)
@@ -30,78 +42,52 @@ class IA_Bomber:
         Returns:
             list: Liste des directions ['H', 'B', 'G', 'D'] ou None si pas de chemin
         """
-        if debut == fin:
-            return []
-        
-        # Initialisation de la recherche
-        queue = [(debut, [])]
-        visites = {debut}
-        
-        # Parcours en largeur (BFS)
-        while queue:
-            (x, y), chemin = queue.pop(0)
-            
-            # Test des 4 directions possibles
-            for dx, dy, direction in [(0, -1, 'H'), (0, 1, 'B'), (-1, 0, 'G'), (1, 0, 'D')]:
-                nouveau_x, nouveau_y = x + dx, y + dy
-                
-                # Si on a trouvé la destination
-                if (nouveau_x, nouveau_y) == fin:
-                    return chemin + [direction]
-                    
-                # Si la case est valide et non visitée
-                if (0 <= nouveau_x < len(carte[0]) and 
-                    0 <= nouveau_y < len(carte) and 
-                    carte[nouveau_y][nouveau_x] != 'C' and 
-                    (nouveau_x, nouveau_y) not in visites):
-                    queue.append(((nouveau_x, nouveau_y), chemin + [direction]))
-                    visites.add((nouveau_x, nouveau_y))
-        return None
-
-    def est_pres_bombe(self, x: int, y: int, game_dict: dict) -> bool:
+        return plus_court_chemin(debut, fin, carte)
+
+    def est_pres_bombe(self, x: int, y: int, game_dict: dict, danger: list = None) -> bool:
         """Vérifie si une position est dans la zone de danger d'une bombe.
         
+        La zone tient compte de la vraie portée des bombes, des colonnes qui
+        arrêtent les rayons et des explosions en chaîne.
+
         Args:
             x (int): Coordonnée x de la position
             y (int): Coordonnée y de la position
             game_dict (dict): État actuel du jeu
+            danger (list): Carte des dangers de game_dict si elle est déjà calculée
+                (action la calcule une fois par tour), sinon elle est calculée ici
 
         Returns:
             bool: True si la position est en danger, False sinon
         """
-        for bombe in game_dict['bombes']:
-            bx, by = bombe['position']
-            # Portée de 2 cases (portée réelle des bombes)
-            if abs(x - bx) + abs(y - by) <= 2:
-                return True
-        return False
+        if danger is None:
+            danger = carte_danger(game_dict)
+        return danger[y * len(game_dict['map'][0]) + x] < INFINI
 
-    def trouver_minerai_proche(self, game_dict: dict) -> tuple:
-        """Trouve le minerai le plus proche et accessible.
+    def chercher_minerai(self, game_dict: dict) -> tuple:
+        """Trouve le minerai le plus proche et le chemin pour l'atteindre, en un seul parcours.
         
         Args:
             game_dict (dict): État actuel du jeu
 
         Returns:
-            tuple: Coordonnées (x, y) du minerai le plus proche ou None si aucun
+            tuple: (coordonnées (x, y) du minerai, liste des directions) ou None si aucun
         """
         carte = game_dict['map']
         pos = game_dict['bombers'][self.num_joueur]['position']
-        x, y = pos
-        
-        # Liste des minerais accessibles avec leur distance
-        minerais = []
-        for i in range(len(carte)):
-            for j in range(len(carte[0])):
-                if carte[i][j] == 'M':
-                    chemin = self.trouver_chemin((x, y), (j, i), carte)
-                    if chemin:
-                        minerais.append(((j, i), len(chemin)))
+        return plus_proche(tuple(pos), carte, 'M', BLOQUANTES)
+
+    def trouver_minerai_proche(self, game_dict: dict) -> tuple:
+        """Trouve le minerai le plus proche et accessible.
         
-        # Retourne le minerai le plus proche
-        if minerais:
-            return min(minerais, key=lambda x: x[1])[0]
-        return None
+        Args:
+            game_dict (dict): État actuel du jeu
+
+        Returns:
+            tuple: Coordonnées (x, y) du minerai le plus proche ou None si aucun
+        """
+        resultat = self.chercher_minerai(game_dict)
+        return resultat[0] if resultat else None
 
     def action(self, game_dict: dict) -> str:
         """Décide de la prochaine action à effectuer.
@@ -116,18 +102,14 @@ class IA_Bomber:
         x, y = pos_actuelle
         carte = game_dict['map']
 
-        # PRIORITÉ 1 : Sécurité - S'éloigner des bombes
-        if self.est_pres_bombe(x, y, game_dict):
-            # Essaie de reculer de 2 cases si possible
-            if x > 1 and carte[y][x-1] != 'C' and carte[y][x-2] != 'C':
-                return 'G'
-            if y > 1 and carte[y-1][x] != 'C' and carte[y-2][x] != 'C':
-                return 'H'
-            # Sinon recule d'une case
-            if x > 0 and carte[y][x-1] != 'C':
-                return 'G'
-            if y > 0 and carte[y-1][x] != 'C':
-                return 'H'
+        # Carte des dangers de ce tour (une seule fois par tour)
+        danger = carte_danger(game_dict)
+
+        # PRIORITÉ 1 : Sécurité - Rejoindre la case sûre la plus proche
+        if self.est_pres_bombe(x, y, game_dict, danger):
+            chemin = fuite((x, y), carte, danger)
+            if chemin:
+                return chemin[0]
             return 'N'
 
         # PRIORITÉ 2 : Attendre que les bombes explosent
@@ -135,9 +117,17 @@ class IA_Bomber:
             return 'N'
 
         # PRIORITÉ 3 : Chercher et détruire les minerais
-        minerai = self.trouver_minerai_proche(game_dict)
-        if minerai:
-            minerai_x, minerai_y = minerai
+        # Le minerai visé est gardé tant qu'il existe : le pas suivant est lu dans
+        # son champ de distances, calculé une fois puis repris du cache à chaque tour.
+        if self.distances is None:
+            self.distances = CacheDistances(carte, BLOQUANTES)
+        else:
+            self.distances.synchroniser(carte)
+        if self.cible is None or carte[self.cible[1]][self.cible[0]] != 'M':
+            resultat = self.chercher_minerai(game_dict)
+            self.cible = resultat[0] if resultat else None
+        if self.cible:
+            minerai_x, minerai_y = self.cible
 
             # Si adjacent au minerai, pose une bombe
             if abs(x - minerai_x) + abs(y - minerai_y) == 1:
@@ -145,9 +135,9 @@ class IA_Bomber:
                 return 'X'
 
             # Sinon se déplace vers le minerai
-            chemin = self.trouver_chemin((x, y), (minerai_x, minerai_y), carte)
-            if chemin:
-                return chemin[0]
+            direction = self.distances.pas_vers(self.cible, (x, y))
+            if direction:
+                return direction
 
         # PRIORITÉ 4 : Gestion du blocage
         if pos_actuelle in self.positions_visitees:
@@ -0,0 +1,177 @@
+from collections import deque
+import time
+
+# Directions dans l'ordre historique de l'IA : (dx, dy, nom)
+DIRECTIONS = ((0, -1, 'H'), (0, 1, 'B'), (-1, 0, 'G'), (1, 0, 'D'))
+
+
+def aplatir(carte) -> str:
+    """Met la carte à plat dans une seule chaîne, ligne par ligne.
+
+    Args:
+        carte: Carte du jeu (liste de chaînes, liste de listes, ou grille dont l'attribut
+            cases contient les octets des cases : bytes, bytearray ou memoryview)
+
+    Returns:
+        str: Les cases de la carte, la case (x, y) étant à l'indice y * largeur + x
+    """
+    cases = getattr(carte, 'cases', None)
+    if isinstance(cases, (bytes, bytearray, memoryview)):
+        return str(cases, 'ascii')
+    return ''.join(''.join(ligne) for ligne in carte)
+
+
+def plus_court_chemin(debut: tuple, fin: tuple, carte, bloquantes: str = 'C') -> list:
+    """Trouve le plus court chemin entre deux points (parcours en largeur).
+
+    La file est une deque, les cases visitées sont marquées dans un tableau
+    plat, et chaque case retient seulement la direction par laquelle on y est
+    arrivé : le chemin n'est reconstruit qu'une fois l'arrivée trouvée. Le coût
+    est donc linéaire en nombre de cases.
+
+    Args:
+        debut (tuple): Position de départ (x, y)
+        fin (tuple): Position d'arrivée (x, y), atteinte même si elle est bloquante
+        carte: Carte du jeu
+        bloquantes (str): Cases qu'on ne peut pas traverser
+
+    Returns:
+        list: Liste des directions ['H', 'B', 'G', 'D'] ou None si pas de chemin
+    """
+    if debut == fin:
+        return []
+
+    largeur, hauteur = len(carte[0]), len(carte)
+    cases = aplatir(carte)
+    fx, fy = fin
+    depart = debut[1] * largeur + debut[0]
+
+    # arrivee[i] = 0 si la case n'est pas visitée, sinon 1 + indice de la direction d'arrivée
+    arrivee = bytearray(largeur * hauteur)
+    arrivee[depart] = 255
+    queue = deque([depart])
+
+    while queue:
+        i = queue.popleft()
+        x, y = i % largeur, i // largeur
+        for k, (dx, dy, direction) in enumerate(DIRECTIONS):
+            nouveau_x, nouveau_y = x + dx, y + dy
+
+            # Si on a trouvé la destination, on remonte les directions jusqu'au départ
+            if nouveau_x == fx and nouveau_y == fy:
+                return remonter(arrivee, i, depart, largeur, direction)
+
+            if 0 <= nouveau_x < largeur and 0 <= nouveau_y < hauteur:
+                j = nouveau_y * largeur + nouveau_x
+                if not arrivee[j] and cases[j] not in bloquantes:
+                    arrivee[j] = k + 1
+                    queue.append(j)
+    return None
+
+
+def plus_proche(debut: tuple, carte, cibles, bloquantes: str = 'C') -> tuple:
+    """Trouve la cible la plus proche avec un seul parcours en largeur.
+
+    Le parcours s'arrête à la première cible rencontrée : le coût ne dépend
+    pas du nombre de cibles sur la carte, il est au plus d'un parcours.
+    Sert pour les minerais, mais aussi les upgrades, les cases sûres, etc.
+
+    Args:
+        debut (tuple): Position de départ (x, y)
+        carte: Carte du jeu
+        cibles: Chaîne des types de cases cherchés (par exemple 'M'),
+            ou fonction cibles(x, y) qui renvoie True pour une case cherchée
+        bloquantes (str): Cases qu'on ne peut pas traverser (une cible est atteinte même si elle l'est)
+
+    Returns:
+        tuple: (position de la cible, liste des directions pour l'atteindre) ou None si aucune
+    """
+    largeur, hauteur = len(carte[0]), len(carte)
+    cases = aplatir(carte)
+    if isinstance(cibles, str):
+        types = cibles
+        cibles = lambda x, y: cases[y * largeur + x] in types
+
+    if cibles(*debut):
+        return debut, []
+
+    depart = debut[1] * largeur + debut[0]
+    arrivee = bytearray(largeur * hauteur)
+    arrivee[depart] = 255
+    queue = deque([depart])
+
+    while queue:
+        i = queue.popleft()
+        x, y = i % largeur, i // largeur
+        for k, (dx, dy, direction) in enumerate(DIRECTIONS):
+            nouveau_x, nouveau_y = x + dx, y + dy
+            if not (0 <= nouveau_x < largeur and 0 <= nouveau_y < hauteur):
+                continue
+            j = nouveau_y * largeur + nouveau_x
+            if arrivee[j]:
+                continue
+            if cibles(nouveau_x, nouveau_y):
+                return (nouveau_x, nouveau_y), remonter(arrivee, i, depart, largeur, direction)
+            if cases[j] not in bloquantes:
+                arrivee[j] = k + 1
+                queue.append(j)
+    return None
+
+
+def remonter(arrivee: bytearray, i: int, depart: int, largeur: int, derniere: str) -> list:
+    """Reconstruit un chemin en remontant les directions d'arrivée depuis la case i."""
+    chemin = [derniere]
+    while i != depart:
+        dx, dy, direction = DIRECTIONS[arrivee[i] - 1]
+        chemin.append(direction)
+        i -= dy * largeur + dx
+    chemin.reverse()
+    return chemin
+
+
+def _carte_test(taille: int) -> list:
+    """Carte carrée avec une bordure et une colonne sur deux, comme les cartes du jeu."""
+    carte = []
+    for y in range(taille):
+        if y in (0, taille - 1):
+            carte.append('C' * taille)
+        elif y % 2 == 0:
+            carte.append(''.join('C' if x % 2 == 0 else ' ' for x in range(taille)))
+        else:
+            carte.append('C' + ' ' * (taille - 2) + 'C')
+    return carte
+
+
+def _chemin_liste(debut: tuple, fin: tuple, carte: list) -> list:
+    """Ancienne version (liste utilisée comme file, chemin recopié à chaque case), pour comparer."""
+    queue = [(debut, [])]
+    visites = {debut}
+    while queue:
+        (x, y), chemin = queue.pop(0)
+        for dx, dy, direction in DIRECTIONS:
+            nouveau_x, nouveau_y = x + dx, y + dy
+            if (nouveau_x, nouveau_y) == fin:
+                return chemin + [direction]
+            if (0 <= nouveau_x < len(carte[0]) and 0 <= nouveau_y < len(carte) and
+                    carte[nouveau_y][nouveau_x] != 'C' and (nouveau_x, nouveau_y) not in visites):
+                queue.append(((nouveau_x, nouveau_y), chemin + [direction]))
+                visites.add((nouveau_x, nouveau_y))
+    return None
+
+
+if __name__ == '__main__':
+    # Banc d'essai : chemin d'un coin à l'autre, le pire cas pour le parcours
+    print(f"{'taille':>7} {'cases':>7} {'deque (ms)':>11} {'µs/case':>8} {'liste (ms)':>11} {'µs/case':>8}")
+    for taille in (25, 50, 100, 150, 200):
+        carte = _carte_test(taille + 1 if taille % 2 == 0 else taille)
+        n = len(carte) * len(carte[0])
+        debut, fin = (1, 1), (len(carte[0]) - 2, len(carte) - 2)
+        t = time.perf_counter()
+        chemin = plus_court_chemin(debut, fin, carte)
+        duree = time.perf_counter() - t
+        t = time.perf_counter()
+        ancien = _chemin_liste(debut, fin, carte)
+        duree_ancien = time.perf_counter() - t
+        assert chemin == ancien
+        print(f"{taille:>7} {n:>7} {duree * 1000:>11.2f} {duree / n * 1e6:>8.3f} "
+              f"{duree_ancien * 1000:>11.2f} {duree_ancien / n * 1e6:>8.3f}")
@@ -0,0 +1,113 @@
+from collections import deque
+import heapq
+
+from chemins import DIRECTIONS, aplatir, remonter
+
+INFINI = 1 << 30  # Case jamais touchée par une explosion
+
+PORTEE_DEFAUT = 2  # Portée d'une bombe si game_dict ne la donne pas
+TIMER_DEFAUT = 1   # Tours avant explosion si game_dict ne les donne pas (on suppose le pire)
+
+
+def carte_danger(game_dict: dict) -> list:
+    """Calcule, pour chaque case, dans combien de tours elle sera touchée par une explosion.
+
+    Les rayons suivent les règles du moteur (Jeu.resoudre_explosions) : ils
+    s'arrêtent sur les colonnes 'C' (non touchées) et sur les murs, fantômes et
+    upgrades (touchés), et traversent les bombes en les faisant exploser en
+    chaîne. Le Bomber ne coupe pas les rayons ici, puisqu'il va bouger.
+    Une bombe touchée par une explosion explose en même temps qu'elle : les
+    bombes sont traitées par date d'explosion croissante.
+
+    Args:
+        game_dict (dict): État du jeu ('map' et 'bombes' avec 'position',
+            et si possible 'portée' et 'timer', le nombre de tours avant explosion)
+
+    Returns:
+        list: Pour chaque case (indice y * largeur + x), le nombre de tours avant
+            qu'elle soit touchée (1 = à la fin de ce tour-ci), INFINI si jamais
+    """
+    carte = game_dict['map']
+    largeur, hauteur = len(carte[0]), len(carte)
+    cases = aplatir(carte)
+    danger = [INFINI] * (largeur * hauteur)
+
+    # Date d'explosion de chaque bombe, qui peut être avancée par une chaîne
+    bombes = {}
+    for bombe in game_dict['bombes']:
+        x, y = bombe['position']
+        bombes[y * largeur + x] = (bombe.get('timer', TIMER_DEFAUT), bombe.get('portée', PORTEE_DEFAUT))
+    dates = {i: timer for i, (timer, _) in bombes.items()}
+    tas = [(timer, i) for i, timer in dates.items()]
+    heapq.heapify(tas)
+    traitees = set()
+
+    while tas:
+        t, i = heapq.heappop(tas)
+        if i in traitees or t > dates[i]:
+            continue
+        traitees.add(i)
+        danger[i] = min(danger[i], t)
+        portee = bombes[i][1]
+        x, y = i % largeur, i // largeur
+        for dx, dy, _ in DIRECTIONS:
+            for k in range(1, portee + 1):
+                nx, ny = x + dx * k, y + dy * k
+                if not (0 <= nx < largeur and 0 <= ny < hauteur):
+                    break
+                j = ny * largeur + nx
+                case = cases[j]
+                if case == 'C':
+                    break
+                danger[j] = min(danger[j], t)
+                if case in 'MFU':
+                    break
+                if j in bombes and t < dates[j]:  # Explosion en chaîne
+                    dates[j] = t
+                    heapq.heappush(tas, (t, j))
+    return danger
+
+
+def fuite(debut: tuple, carte, danger: list, praticables: str = ' U') -> list:
+    """Cherche le plus court chemin vers une case qu'aucune explosion n'atteindra.
+
+    Le parcours tient compte du temps : la case atteinte au pas k ne doit pas
+    exploser avant qu'on l'ait quittée (danger > k).
+
+    Args:
+        debut (tuple): Position de départ (x, y)
+        carte: Carte du jeu
+        danger (list): Résultat de carte_danger
+        praticables (str): Cases sur lesquelles le Bomber peut marcher
+
+    Returns:
+        list: Liste des directions vers la case sûre la plus proche ([] si on y est déjà),
+            ou None s'il n'y a pas d'issue
+    """
+    largeur, hauteur = len(carte[0]), len(carte)
+    cases = aplatir(carte)
+    depart = debut[1] * largeur + debut[0]
+    if danger[depart] >= INFINI:
+        return []
+
+    arrivee = bytearray(largeur * hauteur)
+    arrivee[depart] = 255
+    pas = {depart: 0}
+    queue = deque([depart])
+    while queue:
+        i = queue.popleft()
+        k = pas[i] + 1
+        x, y = i % largeur, i // largeur
+        for n, (dx, dy, direction) in enumerate(DIRECTIONS):
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < largeur and 0 <= ny < hauteur):
+                continue
+            j = ny * largeur + nx
+            if arrivee[j] or cases[j] not in praticables or danger[j] <= k:
+                continue
+            if danger[j] >= INFINI:
+                return remonter(arrivee, i, depart, largeur, direction)
+            arrivee[j] = n + 1
+            pas[j] = k
+            queue.append(j)
+    return None
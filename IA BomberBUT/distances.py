@@ -0,0 +1,227 @@
+from collections import OrderedDict, deque
+import heapq
+
+from chemins import DIRECTIONS, aplatir
+
+INFINI = 1 << 30  # Distance d'une case inaccessible
+
+
+class CacheDistances:
+    """Cache de champs de distances, avec mise à jour incrémentale.
+
+    Un champ de distances donne, pour chaque case, le nombre de pas depuis une
+    case source. Les champs sont gardés en mémoire (les moins récemment
+    utilisés sont oubliés au-delà de la capacité). Quand une case change
+    (mur détruit, bombe posée), les champs déjà calculés sont corrigés
+    localement au lieu d'être recalculés en entier.
+    """
+
+    def __init__(self, carte, bloquantes: str = 'C', capacite: int = 32) -> None:
+        """Prépare le cache pour une carte.
+
+        Args:
+            carte: Carte du jeu
+            bloquantes (str): Cases qu'on ne peut pas traverser
+            capacite (int): Nombre maximum de champs gardés en mémoire
+        """
+        self.largeur, self.hauteur = len(carte[0]), len(carte)
+        self.cases = list(aplatir(carte))
+        self.bloquantes = bloquantes
+        self.capacite = capacite
+        self.champs = OrderedDict()  # source (x, y) -> liste des distances
+        self.succes = 0
+        self.echecs = 0
+
+    # ------------------------------------------------------------------ #
+    # Consultation
+    # ------------------------------------------------------------------ #
+
+    def distances(self, source: tuple) -> list:
+        """Renvoie le champ de distances depuis une source (calculé si absent du cache).
+
+        Args:
+            source (tuple): Case source (x, y), qui peut elle-même être bloquante (un minerai par exemple)
+
+        Returns:
+            list: Distance de chaque case (indice y * largeur + x), INFINI si inaccessible
+        """
+        champ = self.champs.get(source)
+        if champ is not None:
+            self.succes += 1
+            self.champs.move_to_end(source)
+            return champ
+        self.echecs += 1
+        champ = self._calculer(source)
+        self.champs[source] = champ
+        if len(self.champs) > self.capacite:
+            self.champs.popitem(last=False)
+        return champ
+
+    def distance(self, source: tuple, cible: tuple) -> int:
+        """Distance entre deux cases, ou None si la cible est inaccessible."""
+        d = self.distances(source)[cible[1] * self.largeur + cible[0]]
+        return None if d >= INFINI else d
+
+    def pas_vers(self, source: tuple, depuis: tuple) -> str:
+        """Direction du premier pas à faire depuis une case pour se rapprocher de la source.
+
+        Args:
+            source (tuple): Case à atteindre
+            depuis (tuple): Case de départ
+
+        Returns:
+            str: 'H', 'B', 'G' ou 'D', ou None si la source est inaccessible ou déjà atteinte
+        """
+        champ = self.distances(source)
+        x, y = depuis
+        d = champ[y * self.largeur + x]
+        if d == 0 or d >= INFINI:
+            return None
+        for dx, dy, direction in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.largeur and 0 <= ny < self.hauteur and champ[ny * self.largeur + nx] == d - 1:
+                return direction
+        return None
+
+    def statistiques(self) -> dict:
+        """Compteurs du cache (succès, échecs, nombre de champs gardés)."""
+        total = self.succes + self.echecs
+        return {'succes': self.succes, 'echecs': self.echecs, 'champs': len(self.champs),
+                'taux_succes': self.succes / total if total else 0.0}
+
+    # ------------------------------------------------------------------ #
+    # Mises à jour de la carte
+    # ------------------------------------------------------------------ #
+
+    def synchroniser(self, carte) -> None:
+        """Compare la carte avec celle connue du cache et applique les cases modifiées.
+
+        Args:
+            carte: Nouvel état de la carte (mêmes dimensions)
+        """
+        nouvelles = aplatir(carte)
+        if len(nouvelles) != len(self.cases):
+            # Nouvelle carte : rien n'est réutilisable
+            self.__init__(carte, self.bloquantes, self.capacite)
+            return
+        largeur = self.largeur
+        anciennes = ''.join(self.cases)
+        if nouvelles == anciennes:
+            return
+        for debut in range(0, len(nouvelles), largeur):
+            if nouvelles[debut:debut + largeur] != anciennes[debut:debut + largeur]:
+                for i in range(debut, debut + largeur):
+                    if nouvelles[i] != self.cases[i]:
+                        self.changer_case(i % largeur, i // largeur, nouvelles[i])
+
+    def changer_case(self, x: int, y: int, case: str) -> None:
+        """Change une case et corrige les champs en mémoire.
+
+        Args:
+            x (int): Coordonnée x
+            y (int): Coordonnée y
+            case (str): Nouveau contenu de la case
+        """
+        i = y * self.largeur + x
+        etait_bloquante = self.cases[i] in self.bloquantes
+        self.cases[i] = case
+        est_bloquante = case in self.bloquantes
+        if etait_bloquante == est_bloquante:
+            return  # Les distances ne changent pas
+        for source, champ in self.champs.items():
+            if est_bloquante:
+                self._fermer(source, champ, i)
+            else:
+                self._ouvrir(source, champ, i)
+
+    # ------------------------------------------------------------------ #
+    # Calculs internes
+    # ------------------------------------------------------------------ #
+
+    def _voisins(self, i: int):
+        x, y = i % self.largeur, i // self.largeur
+        if y > 0:
+            yield i - self.largeur
+        if y < self.hauteur - 1:
+            yield i + self.largeur
+        if x > 0:
+            yield i - 1
+        if x < self.largeur - 1:
+            yield i + 1
+
+    def _traversable(self, i: int, source: int) -> bool:
+        return i == source or self.cases[i] not in self.bloquantes
+
+    def _calculer(self, source: tuple) -> list:
+        """Parcours en largeur complet depuis la source."""
+        depart = source[1] * self.largeur + source[0]
+        champ = [INFINI] * (self.largeur * self.hauteur)
+        champ[depart] = 0
+        queue = deque([depart])
+        cases, bloquantes = self.cases, self.bloquantes
+        while queue:
+            i = queue.popleft()
+            d = champ[i] + 1
+            for j in self._voisins(i):
+                if champ[j] > d and cases[j] not in bloquantes:
+                    champ[j] = d
+                    queue.append(j)
+        return champ
+
+    def _ouvrir(self, source: tuple, champ: list, i: int) -> None:
+        """Une case devient traversable : les distances ne peuvent que baisser autour d'elle."""
+        depart = source[1] * self.largeur + source[0]
+        if i == depart:
+            return
+        d = min((champ[j] for j in self._voisins(i)), default=INFINI) + 1
+        if d >= INFINI:
+            return
+        champ[i] = d
+        queue = deque([i])
+        while queue:
+            k = queue.popleft()
+            d = champ[k] + 1
+            for j in self._voisins(k):
+                if champ[j] > d and self._traversable(j, depart):
+                    champ[j] = d
+                    queue.append(j)
+
+    def _fermer(self, source: tuple, champ: list, i: int) -> None:
+        """Une case devient bloquante : on retrouve les cases dont tous les plus courts
+        chemins passaient par elle, puis on recalcule seulement ces cases-là."""
+        depart = source[1] * self.largeur + source[0]
+        if i == depart or champ[i] >= INFINI:
+            return
+
+        # 1. Cases touchées, couche par couche à partir de la case fermée
+        touchees = {i}
+        queue = deque([i])
+        while queue:
+            k = queue.popleft()
+            for j in self._voisins(k):
+                if j in touchees or champ[j] != champ[k] + 1:
+                    continue
+                # j reste bon s'il a un autre parent non touché à la distance d - 1
+                if not any(champ[p] == champ[j] - 1 and p not in touchees for p in self._voisins(j)):
+                    touchees.add(j)
+                    queue.append(j)
+
+        # 2. On oublie leurs distances puis on les recalcule depuis la bordure intacte
+        for k in touchees:
+            champ[k] = INFINI
+        tas = []
+        for k in touchees:
+            if k == i:
+                continue
+            d = min((champ[j] for j in self._voisins(k)), default=INFINI) + 1
+            if d < INFINI:
+                champ[k] = d
+                heapq.heappush(tas, (d, k))
+        while tas:
+            d, k = heapq.heappop(tas)
+            if d > champ[k]:
+                continue
+            for j in self._voisins(k):
+                if champ[j] > d + 1 and self._traversable(j, depart):
+                    champ[j] = d + 1
+                    heapq.heappush(tas, (d + 1, j))
@@ -0,0 +1,205 @@
+import sys
+import json
+import time
+import platform
+from statistics import median
+from modele import Jeu, Bombe
+from generateur import generer_carte
+from graphique import RenduTk, dessiner_map
+from vue_ia import PiloteIA, charger_classe_ia, creer_ia
+
+
+#=====================================================
+#============== FICHIER BENCHMARK ====================
+#=====================================================
+
+# Mesure les chemins chauds du jeu sans fenêtre : un tour de jeu, la
+# résolution d'une chaîne d'explosions, le dessin complet de la carte (sur
+# un faux canevas qui compte les appels) et la décision de l'IA, pour
+# plusieurs tailles de carte. Les résultats sont écrits en JSON et peuvent
+# être comparés à une référence enregistrée auparavant.
+
+TAILLES = [(24, 20), (51, 51), (101, 101)]  # Largeur x hauteur des cartes mesurées
+FANTOMES = [8, 64]  # Nombre maximum de fantômes pour la mesure des tours
+REPETITIONS = 5  # Chaque mesure garde la médiane de ses répétitions
+SEUIL = 0.25  # Une mesure plus lente de 25 % que la référence est une régression
+
+
+class RectangleFactice:
+    def __init__(self, col):
+        self.col = col
+
+
+class CanevasCompteur:
+    """
+    Faux canevas tkiteasy : ne dessine rien, compte les appels.
+    """
+    def __init__(self):
+        self.rectangles = 0
+        self.changements = 0
+        self.textes = 0
+        self.changements_textes = 0
+
+    def dessinerRectangle(self, x, y, l, h, col):
+        self.rectangles += 1
+        return RectangleFactice(col)
+
+    def changerCouleur(self, obj, col):
+        self.changements += 1
+        obj.col = col
+
+    def afficherTexte(self, txt, x, y, col="white", sizefont=18):
+        self.textes += 1
+        return RectangleFactice(col)
+
+    def changerTexte(self, obj, txt):
+        self.changements_textes += 1
+
+
+def mesurer(preparer, executer, repetitions=REPETITIONS):
+    """
+    Mesure executer(etat) après preparer() (qui n'est pas chronométré).
+    :return: Durée médiane en secondes.
+    """
+    durees = []
+    for _ in range(repetitions):
+        etat = preparer()
+        debut = time.perf_counter()
+        executer(etat)
+        durees.append(time.perf_counter() - debut)
+    return median(durees)
+
+
+def bench_tours(carte, nb_fantomes, tours=200):
+    """
+    Coût moyen d'un tour de jeu (sans touche) avec nb_fantomes fantômes au plus.
+    """
+    def preparer():
+        jeu = Jeu(None, carte, graine=1)
+        jeu.max_fantomes = nb_fantomes
+        jeu.timer_global = tours + 1
+        jeu.bomber.vie = 10 ** 9  # Le Bomber ne doit pas mourir pendant la mesure
+        return jeu
+
+    def executer(jeu):
+        for _ in range(tours):
+            jeu.handle_key(None)
+
+    return mesurer(preparer, executer) / tours
+
+
+def bench_explosions(carte):
+    """
+    Durée de la résolution d'une chaîne : une bombe sur chaque case vide, une seule déclenchée.
+    La carte doit être sans murs pour que la chaîne atteigne toutes les bombes.
+    :return: (durée, nombre de bombes)
+    """
+    jeu_vide = Jeu(None, carte, graine=1)
+    cases = [(x, y) for x, y in jeu_vide.map_data.trouver(" ")]
+
+    def preparer():
+        jeu = Jeu(None, carte, graine=1)
+        for x, y in cases:
+            bombe = Bombe(x, y, jeu.portée_explosion, tours_avant_explosion=5)
+            jeu.bombes_par_case[(x, y)] = bombe
+            jeu.programmer_bombe(bombe)
+            jeu.map_data.ecrire(x, y, "B")
+        return jeu
+
+    def executer(jeu):
+        jeu.exploser_bombe(next(iter(jeu.bombes)))
+
+    return mesurer(preparer, executer), len(cases)
+
+
+def bench_dessin(carte):
+    """
+    Durée du dessin complet de la carte, puis d'un redessin par RenduTk où rien ne change.
+    :return: (durée du premier dessin, durée du redessin)
+    """
+    premier = mesurer(lambda: CanevasCompteur(), lambda canevas: dessiner_map(canevas, carte, 30))
+
+    def preparer():
+        rendu = RenduTk(CanevasCompteur(), 30)
+        rendu.dessiner_carte(carte)
+        return rendu
+
+    redessin = mesurer(preparer, lambda rendu: rendu.dessiner_carte(carte))
+    return premier, redessin
+
+
+def bench_ia(classe_ia, carte, tours=200):
+    """
+    Latences de décision de l'IA sur une partie.
+    :return: (médiane, 99e percentile) en secondes.
+    """
+    jeu = Jeu(None, carte, graine=1)
+    jeu.bomber.vie = 10 ** 9
+    pilote = PiloteIA(jeu, creer_ia(classe_ia, jeu))
+    pilote.jouer_partie(tours)
+    latences = sorted(pilote.latences)
+    return median(latences), latences[min(len(latences) - 1, len(latences) * 99 // 100)]
+
+
+def lancer_benchmarks(tailles=TAILLES):
+    """
+    Lance toutes les mesures.
+    :return: Dictionnaire nom de la mesure -> durée en microsecondes.
+    """
+    classe_ia = charger_classe_ia()
+    resultats = {}
+    for largeur, hauteur in tailles:
+        carte = generer_carte(largeur, hauteur, graine=0)
+        taille = f"{largeur}x{hauteur}"
+        for nb_fantomes in FANTOMES:
+            resultats[f"tour/{taille}/fantomes={nb_fantomes}"] = bench_tours(carte, nb_fantomes) * 1e6
+        duree, nb_bombes = bench_explosions(generer_carte(largeur, hauteur, graine=0, densite_murs=0))
+        resultats[f"explosions/{taille}/bombes={nb_bombes}"] = duree * 1e6
+        premier, redessin = bench_dessin(carte)
+        resultats[f"dessin/{taille}/complet"] = premier * 1e6
+        resultats[f"dessin/{taille}/redessin"] = redessin * 1e6
+        p50, p99 = bench_ia(classe_ia, carte)
+        resultats[f"ia/{taille}/p50"] = p50 * 1e6
+        resultats[f"ia/{taille}/p99"] = p99 * 1e6
+    return resultats
+
+
+def comparer(resultats, reference, seuil=SEUIL):
+    """
+    Compare des mesures à une référence.
+    :return: Liste des régressions (nom, référence, mesure), mesures absentes de la référence ignorées.
+    """
+    regressions = []
+    for nom, valeur in resultats.items():
+        ancienne = reference.get(nom)
+        if ancienne is not None and valeur > ancienne * (1 + seuil):
+            regressions.append((nom, ancienne, valeur))
+    return regressions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print("Utilisation : python benchmark.py [sortie.json] [reference.json] [seuil]")
+        sys.exit(0)
+    sortie = sys.argv[1] if len(sys.argv) > 1 else "benchmark.json"
+    resultats = lancer_benchmarks()
+    for nom, valeur in resultats.items():
+        print(f"{nom:40} {valeur:12.1f} µs")
+    with open(sortie, "w", encoding="utf-8") as fichier:
+        json.dump({"python": platform.python_version(), "resultats": resultats}, fichier, indent=2)
+    print(f"Résultats enregistrés dans {sortie}")
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], encoding="utf-8") as fichier:
+            reference = json.load(fichier)["resultats"]
+        seuil = float(sys.argv[3]) if len(sys.argv) > 3 else SEUIL
+        regressions = comparer(resultats, reference, seuil)
+        for nom, ancienne, valeur in regressions:
+            print(f"RÉGRESSION {nom} : {ancienne:.1f} -> {valeur:.1f} µs (+{(valeur / ancienne - 1) * 100:.0f} %)")
+        if regressions:
+            sys.exit(1)
+        print(f"Aucune régression au-delà de {seuil * 100:.0f} %")
+
+#=====================================================
+#=====================================================
+#=====================================================
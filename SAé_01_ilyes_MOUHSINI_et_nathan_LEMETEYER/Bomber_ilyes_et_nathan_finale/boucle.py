@@ -0,0 +1,118 @@
+from time import perf_counter
+from entrees import FileEntrees
+
+
+#=====================================================
+#============== FICHIER BOUCLE =======================
+#=====================================================
+
+# Boucle de jeu à pas fixe : le monde avance à une cadence régulière
+# (tours_par_seconde), que le joueur appuie sur une touche ou non. Les touches
+# tapées entre deux tours sont mises dans une FileEntrees, et la boucle en
+# consomme au plus une par tour.
+# La boucle est cadencée par canvas.after, donc elle tourne dans la boucle
+# principale de Tk sans la bloquer.
+
+
+class Boucle:
+    def __init__(self, canvas, tour, tours_par_seconde=5, fini=None, rattrapage_max=3, entrees=None):
+        """
+        :param canvas: Canevas tkiteasy (utilisé pour canvas.after).
+        :param tour: Fonction tour(touche) qui joue un tour ; touche vaut None si rien n'a été tapé.
+        :param tours_par_seconde: Cadence de la simulation.
+        :param fini: Fonction sans argument qui renvoie True quand il faut arrêter la boucle.
+        :param rattrapage_max: Nombre maximum de tours joués d'affilée pour rattraper un retard ;
+                               au-delà, les tours en retard sont abandonnés.
+        :param entrees: File des touches (une FileEntrees par défaut).
+        """
+        self.canvas = canvas
+        self.tour = tour
+        self.pas = 1.0 / tours_par_seconde  # Durée d'un tour en secondes (le budget)
+        self.fini = fini if fini is not None else (lambda: False)
+        self.rattrapage_max = rattrapage_max
+        self.entrees = entrees if entrees is not None else FileEntrees()
+        self.actif = False
+        self.prochain = 0.0  # Instant (perf_counter) du prochain tour
+        self.id_after = None
+
+        # Mesures
+        self.nb_tours = 0
+        self.duree_totale = 0.0
+        self.duree_max = 0.0
+        self.depassements = 0  # Tours qui ont duré plus que le budget
+        self.tours_sautes = 0  # Tours abandonnés parce que la boucle était trop en retard
+
+    def touche_appuyee(self, touche):
+        """
+        Met une touche en attente ; elle sera jouée à un prochain tour.
+        """
+        self.entrees.ajouter(touche)
+
+    def demarrer(self):
+        """
+        Lance la boucle (le premier tour est joué tout de suite).
+        """
+        self.actif = True
+        self.prochain = perf_counter()
+        self.id_after = self.canvas.after(0, self._tic)
+
+    def arreter(self):
+        """
+        Arrête la boucle.
+        """
+        self.actif = False
+        if self.id_after is not None:
+            self.canvas.after_cancel(self.id_after)
+            self.id_after = None
+
+    def _tic(self):
+        """
+        Joue les tours en attente puis programme le prochain appel.
+        """
+        self.id_after = None
+        if not self.actif:
+            return
+
+        maintenant = perf_counter()
+        rattrapes = 0
+        while maintenant >= self.prochain and rattrapes < self.rattrapage_max:
+            touche = self.entrees.prendre()
+            debut = perf_counter()
+            self.tour(touche)
+            self._mesurer(perf_counter() - debut)
+            self.prochain += self.pas
+            rattrapes += 1
+            if self.fini():
+                self.actif = False
+                return
+            maintenant = perf_counter()
+
+        # Trop de retard : on abandonne les tours manqués au lieu de les enchaîner
+        if maintenant >= self.prochain:
+            sautes = int((maintenant - self.prochain) // self.pas) + 1
+            self.tours_sautes += sautes
+            self.prochain += sautes * self.pas
+
+        delai = max(1, int((self.prochain - maintenant) * 1000))
+        self.id_after = self.canvas.after(delai, self._tic)
+
+    def _mesurer(self, duree):
+        self.nb_tours += 1
+        self.duree_totale += duree
+        self.duree_max = max(self.duree_max, duree)
+        if duree > self.pas:
+            self.depassements += 1
+
+    def rapport(self):
+        """
+        :return: Résumé des durées des tours par rapport au budget.
+        """
+        moyenne = self.duree_totale / self.nb_tours if self.nb_tours else 0.0
+        return (f"{self.nb_tours} tours, durée moyenne {moyenne * 1000:.2f} ms, "
+                f"max {self.duree_max * 1000:.2f} ms, budget {self.pas * 1000:.0f} ms, "
+                f"{self.depassements} dépassements, {self.tours_sautes} tours sautés")
+
+
+#=====================================================
+#=====================================================
+#=====================================================
@@ -0,0 +1,35 @@
+#================================================
+#============== FICHIER CARTES ==================
+#================================================
+
+# Cartes du jeu. Elles sont dans un fichier à part pour pouvoir être
+# utilisées sans ouvrir de fenêtre (simulations, IA, tests).
+
+
+# carte du jeu
+map_scenario = [
+    "                        ",
+    "                        ",
+    "                        ",
+    "CCCCCCCCCCCCCCCCCCCCCCCC",
+    "C  P                   C",
+    "CMCMCMCMC C CMC C C C  C", 
+    "CM   M       M    MMM  C",
+    "CMC CMC C C CMC C CMC  C",
+    "C                  M   C",
+    "C C C C C C CMC C C C  C",
+    "C  MM    E  MMM        C",
+    "C CMC C C C C C C C C  C",
+    "C  M               MM  C",
+    "C C C CMCMC C C C CMC  C",
+    "C      MMM     E   M   C",
+    "C CMCMC C C C C C C C  C",
+    "C            M         C",
+    "CMC C C C C CMC C C CMMC",
+    "CMM         MMM      MMC",
+    "CCCCCCCCCCCCCCCCCCCCCCCC"
+]
+
+#================================================
+#================================================
+#================================================
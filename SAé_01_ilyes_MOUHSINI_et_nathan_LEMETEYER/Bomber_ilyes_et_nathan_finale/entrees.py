@@ -0,0 +1,66 @@
+from collections import deque
+
+
+#=====================================================
+#============== FICHIER ENTREES ======================
+#=====================================================
+
+# File d'attente des touches du joueur. Les callbacks Tk ne font qu'ajouter
+# la touche dans la file ; c'est la boucle de jeu qui la consomme, au plus une
+# fois par tour. Sous une rafale de répétitions clavier, la file reste petite
+# et l'interface reste fluide.
+
+
+TOUCHES_DEPLACEMENT = ("Up", "Down", "Left", "Right")
+TOUCHES_JEU = TOUCHES_DEPLACEMENT + ("space",)
+
+
+class FileEntrees:
+    def __init__(self, taille_max=4, politique="fifo"):
+        """
+        :param taille_max: Nombre maximum de touches en attente (les plus anciennes sont oubliées).
+        :param politique: "fifo" pour jouer les touches une par tour dans l'ordre,
+                          "derniere" pour ne jouer que la plus récente et oublier les autres.
+        """
+        if politique not in ("fifo", "derniere"):
+            raise ValueError(f"Politique inconnue : {politique}")
+        self.touches = deque(maxlen=taille_max)
+        self.politique = politique
+        self.ignorees = 0  # Touches fusionnées ou hors jeu
+
+    def __len__(self):
+        return len(self.touches)
+
+    def ajouter(self, touche):
+        """
+        Ajoute une touche dans la file.
+        Les touches qui ne servent pas au jeu sont ignorées, et un déplacement identique
+        au dernier déplacement en attente est fusionné avec lui (répétition clavier).
+        """
+        if touche not in TOUCHES_JEU:
+            self.ignorees += 1
+            return
+        if touche in TOUCHES_DEPLACEMENT and self.touches and self.touches[-1] == touche:
+            self.ignorees += 1
+            return
+        self.touches.append(touche)
+
+    def prendre(self):
+        """
+        :return: La touche à jouer ce tour-ci, ou None si la file est vide.
+        """
+        if not self.touches:
+            return None
+        if self.politique == "derniere":
+            touche = self.touches[-1]
+            self.touches.clear()
+            return touche
+        return self.touches.popleft()
+
+    def vider(self):
+        self.touches.clear()
+
+
+#=====================================================
+#=====================================================
+#=====================================================
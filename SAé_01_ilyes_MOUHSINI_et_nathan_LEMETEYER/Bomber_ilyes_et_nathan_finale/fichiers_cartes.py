@@ -0,0 +1,161 @@
+import os
+import sys
+import glob
+import mmap
+import time
+import struct
+import hashlib
+from collections import namedtuple
+from grille import Grille
+
+
+#=====================================================
+#============== FICHIER FICHIERS CARTES ==============
+#=====================================================
+
+# Cartes enregistrées dans des fichiers texte (une ligne de texte par ligne
+# de la carte). Au premier chargement, la carte est compilée dans un fichier
+# binaire rangé à côté du fichier texte ; ce fichier contient tout ce que le
+# Jeu calcule au démarrage (grille, prises Ethernet, départ du Bomber,
+# masques des colonnes et des murs). Les chargements suivants le lisent par
+# mmap, sans rien analyser.
+#
+# Le nom du fichier compilé contient l'empreinte du texte
+# (carte.txt -> carte.txt.<empreinte>.bbc) : modifier la carte le rend
+# simplement obsolète, et il est remplacé au chargement suivant.
+#
+# Format du fichier compilé : l'entête (voir ENTETE), puis la grille, le
+# masque des colonnes et le masque des murs (largeur x hauteur octets chacun),
+# puis les prises (un u32 par prise, indice y * largeur + x).
+
+
+MAGIQUE = b"BBMC"
+VERSION = 1
+ENTETE = struct.Struct("<4sHHIIIII")  # magique, version, (libre), largeur, hauteur, nb_prises, x et y du départ
+SANS_DEPART = 0xFFFFFFFF  # Coordonnées du départ quand la carte n'a pas de Bomber
+EXTENSION = ".bbc"
+
+# Carte prête à l'emploi pour Jeu (qui l'utilise sans refaire d'analyse)
+CarteCompilee = namedtuple("CarteCompilee", [
+    "grille",    # Grille de la carte
+    "prises",    # Positions (x, y) des prises Ethernet, ligne par ligne
+    "depart",    # Position (x, y) du Bomber, ou None
+    "colonnes",  # bytes, 1 par colonne ('C'), 0 ailleurs
+    "murs",      # bytes, 1 par mur destructible ('M'), 0 ailleurs
+])
+
+
+def lire_texte(texte):
+    """
+    Transforme le texte d'un fichier de carte en Grille.
+    Les lignes plus courtes que la plus longue sont complétées par des cases vides
+    (les éditeurs suppriment souvent les espaces en fin de ligne).
+    :param texte: Contenu du fichier (bytes).
+    :return: La carte (Grille).
+    """
+    lignes = texte.decode("ascii").replace("\r\n", "\n").split("\n")
+    while lignes and not lignes[-1]:
+        lignes.pop()
+    largeur = max((len(ligne) for ligne in lignes), default=0)
+    return Grille([ligne.ljust(largeur) for ligne in lignes])
+
+
+def compiler(grille):
+    """
+    :return: Le contenu du fichier compilé d'une carte (bytes).
+    """
+    l = grille.largeur
+    prises = []
+    i = grille.cases.find(ord("E"))
+    while i != -1:
+        prises.append(i)
+        i = grille.cases.find(ord("E"), i + 1)
+    depart = grille.trouver_premier("P") or (SANS_DEPART, SANS_DEPART)
+    entete = ENTETE.pack(MAGIQUE, VERSION, 0, l, grille.hauteur, len(prises), *depart)
+    return b"".join([entete, grille.cases, grille.masque("C"), grille.masque("M"),
+                     struct.pack(f"<{len(prises)}I", *prises)])
+
+
+def decompiler(donnees):
+    """
+    Lit le contenu d'un fichier compilé (bytes, mmap, ...).
+    :return: La CarteCompilee.
+    """
+    magique, version, _, l, h, nb_prises, x, y = ENTETE.unpack_from(donnees, 0)
+    n = l * h
+    if magique != MAGIQUE or version != VERSION or len(donnees) != ENTETE.size + 3 * n + 4 * nb_prises:
+        raise ValueError("Fichier de carte compilée invalide")
+    with memoryview(donnees) as vue:
+        debut = ENTETE.size
+        grille = Grille.depuis_octets(l, h, vue[debut:debut + n])
+        colonnes = bytes(vue[debut + n:debut + 2 * n])
+        murs = bytes(vue[debut + 2 * n:debut + 3 * n])
+    indices = struct.unpack_from(f"<{nb_prises}I", donnees, ENTETE.size + 3 * n)
+    prises = tuple((i % l, i // l) for i in indices)
+    depart = None if x == SANS_DEPART else (x, y)
+    return CarteCompilee(grille, prises, depart, colonnes, murs)
+
+
+def chemin_compile(chemin, texte):
+    """
+    :return: Chemin du fichier compilé d'une carte, d'après l'empreinte de son texte.
+    """
+    return f"{chemin}.{hashlib.sha1(texte).hexdigest()[:16]}{EXTENSION}"
+
+
+def charger_carte(chemin):
+    """
+    Charge une carte depuis un fichier texte, en passant par son fichier compilé.
+    Si le fichier compilé n'existe pas (ou plus), il est créé ; si le dossier n'est pas
+    accessible en écriture, la carte est compilée en mémoire seulement.
+    :param chemin: Chemin du fichier texte de la carte.
+    :return: La CarteCompilee (à passer directement à Jeu).
+    """
+    with open(chemin, "rb") as fichier:
+        texte = fichier.read()
+    fichier_compile = chemin_compile(chemin, texte)
+    try:
+        with open(fichier_compile, "rb") as fichier, mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as donnees:
+            return decompiler(donnees)
+    except (OSError, ValueError, struct.error):
+        pass  # Pas encore compilée, ou fichier compilé abîmé : on recompile
+
+    donnees = compiler(lire_texte(texte))
+    try:
+        # Versions compilées d'anciens textes de cette carte seulement (chemin.<16 hex>.bbc) :
+        # pas celles d'une autre carte dont le nom commence pareil (carte.txt.v2, ...)
+        for ancien in glob.glob(glob.escape(chemin) + "." + "[0-9a-f]" * 16 + glob.escape(EXTENSION)):
+            os.remove(ancien)
+        temporaire = f"{fichier_compile}.{os.getpid()}.tmp"
+        with open(temporaire, "wb") as fichier:
+            fichier.write(donnees)
+        os.replace(temporaire, fichier_compile)  # Jamais de fichier compilé à moitié écrit
+    except OSError:
+        pass
+    return decompiler(donnees)
+
+
+def enregistrer_carte(carte, chemin):
+    """
+    Écrit une carte dans un fichier texte.
+    :param carte: La carte (liste de chaînes ou Grille).
+    """
+    lignes = carte.lignes() if isinstance(carte, Grille) else list(carte)
+    with open(chemin, "w", encoding="ascii", newline="\n") as fichier:
+        fichier.write("\n".join(lignes) + "\n")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Utilisation : python fichiers_cartes.py fichier_carte")
+        sys.exit(1)
+    for essai in ("premier chargement", "chargement suivant"):
+        debut = time.perf_counter()
+        carte = charger_carte(sys.argv[1])
+        duree = time.perf_counter() - debut
+        print(f"{essai} : {carte.grille.largeur}x{carte.grille.hauteur}, {len(carte.prises)} prises, "
+              f"départ {carte.depart}, {duree * 1000:.1f} ms")
+
+#=====================================================
+#=====================================================
+#=====================================================
@@ -0,0 +1,164 @@
+import sys
+import time
+import random
+from grille import Grille
+
+
+#=====================================================
+#============== FICHIER GENERATEUR ===================
+#=====================================================
+
+# Génère des cartes de la taille voulue avec le même alphabet que
+# map_scenario : bord et quadrillage de colonnes ('C'), murs destructibles
+# ('M') au hasard, prises Ethernet ('E') et départ du Bomber ('P').
+# Tout est fait sur les octets de la Grille (randbytes, translate, affectation
+# par tranches), sans boucle Python case par case : une carte de 2000x2000
+# est générée en une fraction de seconde.
+
+
+def generer_carte(largeur, hauteur, graine=None, densite_murs=0.3, densite_prises=0.005, depart=(1, 1)):
+    """
+    Génère une carte.
+    :param largeur: Largeur de la carte (au moins 5).
+    :param hauteur: Hauteur de la carte (au moins 5).
+    :param graine: Graine du hasard (même graine et mêmes paramètres donnent la même carte).
+    :param densite_murs: Proportion des cases libres occupées par un mur, entre 0 et 1.
+    :param densite_prises: Proportion des cases de la carte occupées par une prise Ethernet.
+    :param depart: Position (x, y) du Bomber. Les cases autour sont laissées vides.
+    :return: La carte (Grille).
+    """
+    if largeur < 5 or hauteur < 5:
+        raise ValueError("La carte doit faire au moins 5x5 cases")
+    hasard = random.Random(graine)
+    n = largeur * hauteur
+
+    # Murs : un octet au hasard par case, transformé en 'M' ou ' ' selon la densité
+    seuil = round(densite_murs * 256)
+    table = bytes(ord("M") if i < seuil else ord(" ") for i in range(256))
+    cases = bytearray(hasard.randbytes(n).translate(table))
+
+    # Bord et colonnes (x et y pairs, jamais collées au bord)
+    cases[0:largeur] = b"C" * largeur
+    cases[n - largeur:n] = b"C" * largeur
+    cases[0::largeur] = b"C" * hauteur
+    cases[largeur - 1::largeur] = b"C" * hauteur
+    nb_colonnes = len(range(2, largeur - 2, 2))
+    for y in range(2, hauteur - 2, 2):
+        cases[y * largeur + 2:(y + 1) * largeur - 2:2] = b"C" * nb_colonnes
+
+    # Départ du Bomber, avec un peu de place autour pour poser une bombe et s'enfuir
+    x0, y0 = depart
+    if not (0 < x0 < largeur - 1 and 0 < y0 < hauteur - 1) or cases[y0 * largeur + x0] == ord("C"):
+        raise ValueError(f"Le départ {depart} tombe sur une colonne ou hors de la carte")
+    zone_depart = set()
+    for dy in range(-2, 3):
+        for dx in range(-2 + abs(dy), 3 - abs(dy)):
+            x, y = x0 + dx, y0 + dy
+            if 0 <= x < largeur and 0 <= y < hauteur and cases[y * largeur + x] != ord("C"):
+                cases[y * largeur + x] = ord(" ")
+                zone_depart.add(y * largeur + x)
+    cases[y0 * largeur + x0] = ord("P")
+
+    # Prises Ethernet
+    nb_prises = max(1, round(n * densite_prises))
+    for i in hasard.sample(range(n), nb_prises):
+        if cases[i] != ord("C") and i not in zone_depart:
+            cases[i] = ord("E")
+
+    grille = Grille.depuis_octets(largeur, hauteur, cases)
+    if not est_connexe(grille, depart):
+        raise ValueError("Le départ du Bomber n'est pas relié au reste de la carte")
+    return grille
+
+
+# ===================================================================== #
+# =========================== CONNEXITÉ =============================== #
+# ===================================================================== #
+
+# Le remplissage travaille sur des entiers Python où chaque bit est une case :
+# une addition propage la retenue le long d'une suite de cases libres, donc
+# une ligne entière est remplie en une opération. On alterne les quatre sens
+# (lignes, lignes à l'envers, colonnes, colonnes à l'envers) jusqu'à ce que
+# plus rien ne change ; il faut autant de passes que de virages dans le
+# chemin le plus tordu, et non autant que de cases.
+
+LIBRES = bytes(ord("0") if i == ord("C") else ord("1") for i in range(256))
+
+
+def _remplir(graines, masque):
+    """
+    Étend chaque graine vers les bits de poids fort, jusqu'au bout de sa suite de 1 dans masque.
+    """
+    return (((graines + masque) ^ masque) | graines) & masque
+
+
+def _sens(largeur, hauteur):
+    """
+    :return: Liste de (aller, retour, inverse) : aller transforme la chaîne des cases (ligne par
+             ligne) en chaîne de bits où les lignes, ou les colonnes, sont séparées par un '0' ;
+             retour fait l'inverse ; inverse indique si la chaîne est lue à l'envers.
+    """
+    l, h = largeur, hauteur
+
+    def lignes(texte):
+        return "0".join(texte[i:i + l] for i in range(0, l * h, l))
+
+    def lignes_retour(bits):
+        return "".join(bits[i:i + l] for i in range(0, len(bits), l + 1))
+
+    def colonnes(texte):
+        return "0".join(texte[x::l] for x in range(l))
+
+    def colonnes_retour(bits):
+        texte = "".join(bits[i:i + h] for i in range(0, len(bits), h + 1))
+        return "".join(texte[y::h] for y in range(h))
+
+    return [(lignes, lignes_retour, False), (lignes, lignes_retour, True),
+            (colonnes, colonnes_retour, False), (colonnes, colonnes_retour, True)]
+
+
+def est_connexe(grille, depart):
+    """
+    Vérifie que toutes les cases qui ne sont pas des colonnes sont reliées au départ.
+    Les murs, prises et bombes comptent comme libres : le Bomber peut les détruire.
+    :param grille: La carte (Grille).
+    :param depart: Position (x, y) de départ.
+    :return: True si tout le reste de la carte est atteignable depuis le départ.
+    """
+    l, h = grille.largeur, grille.hauteur
+    x0, y0 = depart
+    libres = grille.cases.translate(LIBRES).decode("ascii")
+    if libres[y0 * l + x0] != "1":
+        return False
+    atteint = "0" * (y0 * l + x0) + "1" + "0" * (l * h - y0 * l - x0 - 1)
+
+    passes = []
+    for aller, retour, inverse in _sens(l, h):
+        bits = aller(libres)
+        passes.append((aller, retour, inverse, int(bits[::-1] if inverse else bits, 2), len(bits)))
+
+    precedent = None
+    while atteint != precedent:
+        precedent = atteint
+        for aller, retour, inverse, masque, longueur in passes:
+            bits = aller(atteint)
+            graines = _remplir(int(bits[::-1] if inverse else bits, 2), masque)
+            bits = format(graines, f"0{longueur}b")
+            atteint = retour(bits[::-1] if inverse else bits)
+    return atteint == libres
+
+
+if __name__ == "__main__":
+    largeur = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    hauteur = int(sys.argv[2]) if len(sys.argv) > 2 else largeur
+    debut = time.perf_counter()
+    grille = generer_carte(largeur, hauteur, graine=0)
+    duree = time.perf_counter() - debut
+    if largeur <= 80:
+        print("\n".join(grille.lignes()))
+    print(f"Carte {largeur}x{hauteur} générée en {duree * 1000:.0f} ms "
+          f"({grille.compter('M')} murs, {grille.compter('E')} prises)")
+
+#=====================================================
+#=====================================================
+#=====================================================
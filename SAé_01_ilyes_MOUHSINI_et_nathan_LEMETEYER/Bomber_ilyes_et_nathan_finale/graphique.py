@@ -1,5 +1,3 @@
-from tkiteasy import *
-
 #=====================================================
 #============== FICHIER GRAPHIQUE ====================
 #=====================================================
@@ -7,27 +5,163 @@ from tkiteasy import *
 
 TAILLE_CASE = 30  # Taille des cases pour l'affichage
 
-def dessiner_map(canvas, map_data, taille_c):
+COULEURS = {
+    "C": "gray",    # Colonne indestructible
+    "M": "brown",   # Mur destructible
+    "E": "blue",    # Prise Ethernet
+    "P": "green",   # Bomber
+    "F": "red",     # Fantôme
+    "U": "yellow",  # Upgrade
+    "B": "white",   # Bombe
+    " ": "black",   # Case vide
+}
+
+# Informations affichées dans un bandeau au-dessus de la carte :
+# ordre des valeurs passées à Rendu.afficher_infos et leur libellé
+CHAMPS_INFOS = ("Score", "Vie", "Temps", "Niveau")
+TAILLE_POLICE_INFOS = 16
+BANDEAU_INFOS = 40  # Hauteur en pixels du bandeau, la carte est dessinée en dessous
+
+def taille_fenetre(largeur, hauteur, taille_c=TAILLE_CASE, bandeau=BANDEAU_INFOS):
+    """
+    :param largeur: Largeur de la carte en cases.
+    :param hauteur: Hauteur de la carte en cases.
+    :return: (largeur, hauteur) en pixels de la fenêtre qui contient le bandeau et la carte.
+    """
+    return largeur * taille_c, bandeau + hauteur * taille_c
+
+def dessiner_map(canvas, map_data, taille_c, y0=0):
     """
     Dessine la carte sur le canevas.
     :param canvas: Le canevas où dessiner.
     :param map_data: Les données de la carte (liste de chaînes).
     :param taille_c: La taille des cases en pixels.
+    :param y0: Ordonnée en pixels du haut de la carte.
+    :return: Grille (liste de listes) des rectangles créés, un par case.
     """
+    cases = []
     for y, row in enumerate(map_data):
+        ligne = []
         for x, cell in enumerate(row):
-            px, py = x * taille_c, y * taille_c
-            color = {
-                "C": "gray",    # Colonne indestructible
-                "M": "brown",   # Mur destructible
-                "E": "blue",    # Prise Ethernet
-                "P": "green",   # Bomber
-                "F": "red",     # Fantôme
-                "U": "yellow",  # Upgrade
-                "B": "white",   # Bombe
-                " ": "black",   # Case vide
-            }.get(cell, "black")
-            canvas.dessinerRectangle(px, py, taille_c, taille_c, color)
+            px, py = x * taille_c, y0 + y * taille_c
+            color = COULEURS.get(cell, "black")
+            ligne.append(canvas.dessinerRectangle(px, py, taille_c, taille_c, color))
+        cases.append(ligne)
+    return cases
+
+
+# ===================================================================== #
+# ============================ RENDUS ================================= #
+# ===================================================================== #
+
+# Le modèle (Jeu) ne parle jamais directement au canevas : il passe par un
+# rendu. RenduTk dessine dans une fenêtre tkiteasy, RenduNul ne fait rien et
+# permet de faire tourner le jeu sans écran (simulations, IA, tests).
+
+class Rendu:
+    """
+    Interface commune des rendus utilisés par le Jeu.
+    """
+    def dessiner_carte(self, map_data):
+        """
+        Dessine la carte complète.
+        :param map_data: Les données de la carte.
+        """
+        raise NotImplementedError
+
+    def dessiner_case(self, x, y, cell):
+        """
+        Redessine une seule case.
+        :param x: Coordonnée x de la case.
+        :param y: Coordonnée y de la case.
+        :param cell: Contenu de la case ("C", "M", "P", ...).
+        """
+        raise NotImplementedError
+
+    def afficher_infos(self, score, vie, temps, niveau):
+        """
+        Affiche les informations de la partie (appelé à chaque rafraîchissement).
+        :param score: Score du Bomber.
+        :param vie: Points de vie du Bomber.
+        :param temps: Nombre de tours restants (timer_global).
+        :param niveau: Niveau du Bomber.
+        """
+        raise NotImplementedError
+
+    def fermer(self):
+        """
+        Termine l'affichage (fin de partie).
+        """
+        raise NotImplementedError
+
+
+class RenduTk(Rendu):
+    """
+    Rendu dans un canevas tkiteasy.
+    Les rectangles des cases sont créés une seule fois (dessiner_carte), ensuite
+    on ne fait que changer leur couleur : le nombre d'objets du canevas reste
+    égal à largeur x hauteur pendant toute la partie.
+    Il en va de même pour les textes des informations : créés une fois dans le
+    bandeau au-dessus de la carte, puis modifiés seulement quand leur valeur change.
+    """
+    def __init__(self, canvas, taille_c=TAILLE_CASE, bandeau=BANDEAU_INFOS):
+        self.canvas = canvas
+        self.taille_c = taille_c
+        self.bandeau = bandeau  # Hauteur en pixels réservée aux informations
+        self.cases = None  # Rectangles des cases, créés au premier dessin
+        self.textes = None  # Textes des informations, créés au premier affichage
+        self.valeurs = None  # Dernières valeurs affichées, dans l'ordre de CHAMPS_INFOS
+
+    def dessiner_carte(self, map_data):
+        if self.cases is None:
+            self.cases = dessiner_map(self.canvas, map_data, self.taille_c, self.bandeau)
+            return
+        for y, row in enumerate(map_data):
+            for x, cell in enumerate(row):
+                self.dessiner_case(x, y, cell)
+
+    def dessiner_case(self, x, y, cell):
+        rectangle = self.cases[y][x]
+        color = COULEURS.get(cell, "black")
+        if rectangle.col != color:  # Évite un appel Tk si rien ne change
+            self.canvas.changerCouleur(rectangle, color)
+
+    def afficher_infos(self, score, vie, temps, niveau):
+        valeurs = (score, vie, temps, niveau)
+        if self.textes is None:
+            # Champs répartis sur la largeur de la carte, centrés dans le bandeau
+            largeur = len(self.cases[0]) * self.taille_c
+            y = self.bandeau // 2
+            self.textes = [
+                self.canvas.afficherTexte(f"{champ} : {valeur}", largeur * (2 * i + 1) // 8, y,
+                                          sizefont=TAILLE_POLICE_INFOS)
+                for i, (champ, valeur) in enumerate(zip(CHAMPS_INFOS, valeurs))
+            ]
+        else:
+            for i, valeur in enumerate(valeurs):
+                if valeur != self.valeurs[i]:  # Un seul appel Tk par valeur modifiée
+                    self.canvas.changerTexte(self.textes[i], f"{CHAMPS_INFOS[i]} : {valeur}")
+        self.valeurs = valeurs
+
+    def fermer(self):
+        self.canvas.fermerFenetre()
+
+
+class RenduNul(Rendu):
+    """
+    Rendu qui n'affiche rien (mode sans fenêtre).
+    """
+    def dessiner_carte(self, map_data):
+        pass
+
+    def dessiner_case(self, x, y, cell):
+        pass
+
+    def afficher_infos(self, score, vie, temps, niveau):
+        pass
+
+    def fermer(self):
+        pass
 
 
 #=====================================================
@@ -0,0 +1,165 @@
+#=====================================================
+#============== FICHIER GRILLE =======================
+#=====================================================
+
+# Stockage compact de la carte : un seul bytearray de largeur x hauteur
+# octets (un octet par case, le code ASCII du caractère de la case) au lieu
+# d'une liste de listes de chaînes. Les recherches sur toute la carte
+# (trouver, compter, masque) sont faites par les méthodes de bytearray,
+# donc en C, sans boucle Python case par case.
+
+
+def _indice(i, taille):
+    """
+    Indice comme dans une liste : négatif = compté depuis la fin, IndexError hors limites.
+    """
+    if i < 0:
+        i += taille
+    if not 0 <= i < taille:
+        raise IndexError(i)
+    return i
+
+
+class Ligne:
+    """
+    Vue sur une ligne de la grille, pour garder l'écriture map_data[y][x].
+    Les indices x se comportent comme ceux d'une chaîne (négatifs acceptés, IndexError
+    hors de la ligne) : on ne peut pas lire ou écrire dans la ligne voisine.
+    """
+    def __init__(self, grille, y):
+        self.grille = grille
+        self.debut = y * grille.largeur
+
+    def __len__(self):
+        return self.grille.largeur
+
+    def __getitem__(self, x):
+        return chr(self.grille.cases[self.debut + _indice(x, self.grille.largeur)])
+
+    def __setitem__(self, x, cell):
+        self.grille.cases[self.debut + _indice(x, self.grille.largeur)] = ord(cell)
+
+    def __iter__(self):
+        debut = self.debut
+        return iter(self.grille.cases[debut:debut + self.grille.largeur].decode("ascii"))
+
+    def __str__(self):
+        debut = self.debut
+        return self.grille.cases[debut:debut + self.grille.largeur].decode("ascii")
+
+
+class Grille:
+    def __init__(self, lignes):
+        """
+        Crée une grille à partir d'une carte.
+        :param lignes: Liste de chaînes (ou de listes de caractères), toutes de même longueur.
+        """
+        self.hauteur = len(lignes)
+        self.largeur = len(lignes[0]) if lignes else 0
+        self.cases = bytearray("".join("".join(row) for row in lignes), "ascii")
+        if len(self.cases) != self.largeur * self.hauteur:
+            raise ValueError("Toutes les lignes de la carte doivent avoir la même longueur")
+
+    # --------------------------- accès aux cases ---------------------------
+
+    def dans(self, x, y):
+        """
+        :return: True si (x, y) est dans la grille.
+        """
+        return 0 <= x < self.largeur and 0 <= y < self.hauteur
+
+    def lire(self, x, y):
+        """
+        :return: Le caractère de la case (x, y).
+        """
+        return chr(self.cases[y * self.largeur + x])
+
+    def ecrire(self, x, y, cell):
+        """
+        Change le contenu de la case (x, y).
+        """
+        self.cases[y * self.largeur + x] = ord(cell)
+
+    def __len__(self):
+        return self.hauteur
+
+    def __getitem__(self, y):
+        return Ligne(self, _indice(y, self.hauteur))
+
+    def __iter__(self):
+        for y in range(self.hauteur):
+            yield Ligne(self, y)
+
+    @classmethod
+    def depuis_octets(cls, largeur, hauteur, cases):
+        """
+        Crée une grille à partir de ses octets (un code ASCII par case, ligne par ligne).
+        """
+        if len(cases) != largeur * hauteur:
+            raise ValueError("Nombre d'octets incompatible avec les dimensions de la grille")
+        grille = cls.__new__(cls)
+        grille.largeur, grille.hauteur = largeur, hauteur
+        grille.cases = bytearray(cases)
+        return grille
+
+    def copie(self):
+        """
+        :return: Nouvelle grille indépendante avec le même contenu.
+        """
+        return Grille.depuis_octets(self.largeur, self.hauteur, self.cases)
+
+    def lignes(self):
+        """
+        :return: Copie de la carte sous forme de liste de chaînes.
+        """
+        l = self.largeur
+        texte = self.cases.decode("ascii")
+        return [texte[i:i + l] for i in range(0, len(texte), l)]
+
+    # ------------------------ requêtes sur toute la carte ------------------
+
+    def trouver(self, cell):
+        """
+        Trouve toutes les cases d'un type donné.
+        :param cell: Caractère recherché ("E", "X", ...).
+        :return: Liste des positions (x, y), ligne par ligne.
+        """
+        code = ord(cell)
+        cases, l = self.cases, self.largeur
+        positions = []
+        i = cases.find(code)
+        while i != -1:
+            positions.append((i % l, i // l))
+            i = cases.find(code, i + 1)
+        return positions
+
+    def trouver_premier(self, cell):
+        """
+        :return: Position (x, y) de la première case du type donné, ou None.
+        """
+        i = self.cases.find(ord(cell))
+        if i == -1:
+            return None
+        return i % self.largeur, i // self.largeur
+
+    def compter(self, cell):
+        """
+        :return: Nombre de cases du type donné.
+        """
+        return self.cases.count(ord(cell))
+
+    def masque(self, cells):
+        """
+        Calcule le masque des cases dont le type est dans cells.
+        :param cells: Chaîne des caractères acceptés (par exemple " U" pour les cases praticables).
+        :return: bytes de largeur x hauteur octets, 1 si la case est acceptée, 0 sinon.
+        """
+        table = bytearray(256)
+        for cell in cells:
+            table[ord(cell)] = 1
+        return bytes(self.cases.translate(table))
+
+
+#=====================================================
+#=====================================================
+#=====================================================
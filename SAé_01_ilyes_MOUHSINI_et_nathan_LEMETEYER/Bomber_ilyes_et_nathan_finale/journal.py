@@ -0,0 +1,121 @@
+import sys
+from collections import deque
+
+
+#=====================================================
+#============== FICHIER JOURNAL ======================
+#=====================================================
+
+# Journal des événements d'une partie (fantôme généré, Bomber touché, ...).
+# Remplace les print du modèle :
+# - chaque événement a un niveau, et les événements sous le niveau du journal
+#   sont ignorés tout de suite, sans même formater le message ;
+# - les derniers événements sont gardés en mémoire (tampon circulaire) pour
+#   pouvoir les relire après la partie ;
+# - l'écriture vers un fichier ou la console se fait par lots.
+
+
+DEBUG = 10   # Détail de chaque tour
+INFO = 20    # Événements de la partie
+ALERTE = 30  # Événements importants (fin de partie, ...)
+
+NOMS_NIVEAUX = {DEBUG: "DEBUG", INFO: "INFO", ALERTE: "ALERTE"}
+
+
+class Journal:
+    def __init__(self, niveau=INFO, taille=1000, sortie=None, lot=100):
+        """
+        :param niveau: Niveau minimum des événements gardés (None = journal désactivé).
+        :param taille: Nombre d'événements gardés en mémoire (les plus anciens sont oubliés).
+        :param sortie: Fichier ouvert, chemin de fichier, ou None pour ne rien écrire.
+                       Un fichier donné par son chemin est ouvert ici et refermé par fermer().
+        :param lot: Nombre d'événements accumulés avant d'écrire dans la sortie.
+        """
+        self.niveau = niveau
+        self.evenements = deque(maxlen=taille)  # (tour, niveau, message, arguments)
+        self.fichier_propre = isinstance(sortie, str)  # True si le journal a ouvert la sortie lui-même
+        if self.fichier_propre:
+            sortie = open(sortie, "a", encoding="utf-8")
+        self.sortie = sortie
+        self.lot = lot
+        self.en_attente = []  # Événements pas encore écrits dans la sortie
+
+    def actif(self, niveau):
+        """
+        :return: True si un événement de ce niveau serait enregistré.
+        """
+        return self.niveau is not None and niveau >= self.niveau
+
+    def ecrire(self, niveau, tour, message, *arguments):
+        """
+        Enregistre un événement.
+        :param niveau: DEBUG, INFO ou ALERTE.
+        :param tour: Tour de jeu de l'événement.
+        :param message: Message, avec des {} remplacés par les arguments (str.format).
+        """
+        if self.niveau is None or niveau < self.niveau:
+            return
+        evenement = (tour, niveau, message, arguments)
+        self.evenements.append(evenement)
+        if self.sortie is not None:
+            self.en_attente.append(evenement)
+            if len(self.en_attente) >= self.lot:
+                self.vider()
+
+    def debug(self, tour, message, *arguments):
+        self.ecrire(DEBUG, tour, message, *arguments)
+
+    def info(self, tour, message, *arguments):
+        self.ecrire(INFO, tour, message, *arguments)
+
+    def alerte(self, tour, message, *arguments):
+        self.ecrire(ALERTE, tour, message, *arguments)
+
+    def vider(self):
+        """
+        Écrit dans la sortie les événements en attente.
+        """
+        if self.sortie is None or not self.en_attente:
+            return
+        self.sortie.write("".join(formater(e) + "\n" for e in self.en_attente))
+        self.sortie.flush()
+        self.en_attente.clear()
+
+    def fermer(self):
+        """
+        Écrit les événements en attente et ferme la sortie si le journal l'a ouverte
+        (une sortie donnée déjà ouverte, comme la console, reste ouverte).
+        Dans tous les cas, les événements suivants sont seulement gardés en mémoire.
+        """
+        self.vider()
+        if self.fichier_propre:
+            self.sortie.close()
+            self.fichier_propre = False
+        self.sortie = None
+
+    def lire(self, niveau=DEBUG):
+        """
+        :param niveau: Niveau minimum des événements à relire.
+        :return: Les événements gardés en mémoire, sous forme de lignes de texte.
+        """
+        return [formater(e) for e in self.evenements if e[1] >= niveau]
+
+
+def formater(evenement):
+    """
+    :return: La ligne de texte d'un événement du journal.
+    """
+    tour, niveau, message, arguments = evenement
+    return f"[{tour:4}] {NOMS_NIVEAUX.get(niveau, niveau):6} {message.format(*arguments)}"
+
+
+def journal_console(niveau=DEBUG):
+    """
+    :return: Journal qui écrit chaque événement tout de suite dans la console.
+    """
+    return Journal(niveau, sortie=sys.stdout, lot=1)
+
+
+#=====================================================
+#=====================================================
+#=====================================================
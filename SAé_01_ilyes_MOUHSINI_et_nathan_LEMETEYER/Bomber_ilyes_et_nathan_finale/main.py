@@ -1,5 +1,10 @@
+import sys
 from modele import *
-from graphique import dessiner_map
+from cartes import map_scenario
+from fichiers_cartes import CarteCompilee, charger_carte
+from graphique import dessiner_map, taille_fenetre
+from boucle import Boucle
+from replay import enregistrer_replay
 from tkiteasy import ouvrirFenetre
 
 
@@ -10,54 +15,39 @@ from tkiteasy import ouvrirFenetre
 
 
 
-# Dimensions de la fenêtre
-LARGEUR = 718
-HAUTEUR = 600
-
-# carte du jeu
-map_scenario = [
-    "                        ",
-    "                        ",
-    "                        ",
-    "CCCCCCCCCCCCCCCCCCCCCCCC",
-    "C  P                   C",
-    "CMCMCMCMC C CMC C C C  C", 
-    "CM   M       M    MMM  C",
-    "CMC CMC C C CMC C CMC  C",
-    "C                  M   C",
-    "C C C C C C CMC C C C  C",
-    "C  MM    E  MMM        C",
-    "C CMC C C C C C C C C  C",
-    "C  M               MM  C",
-    "C C C CMCMC C C C CMC  C",
-    "C      MMM     E   M   C",
-    "C CMCMC C C C C C C C  C",
-    "C            M         C",
-    "CMC C C C C CMC C C CMMC",
-    "CMM         MMM      MMC",
-    "CCCCCCCCCCCCCCCCCCCCCCCC"
-]
+# Cadence du jeu (le monde avance même si le joueur n'appuie sur rien)
+TOURS_PAR_SECONDE = 5
+
+# Fichier où est enregistrée la dernière partie (relecture : python replay.py derniere_partie.bbr)
+FICHIER_REPLAY = "derniere_partie.bbr"
+
 
 def main():
-    # Initialisation de la fenêtre graphique
-    canvas = ouvrirFenetre(LARGEUR, HAUTEUR)
+    # Carte à jouer (python main.py fichier_carte pour une autre carte)
+    carte = charger_carte(sys.argv[1]) if len(sys.argv) > 1 else map_scenario
+    grille = carte.grille if isinstance(carte, CarteCompilee) else carte
+
+    # Initialisation de la fenêtre graphique, à la taille de la carte et du bandeau d'informations
+    canvas = ouvrirFenetre(*taille_fenetre(len(grille[0]), len(grille)))
 
     # Accéder à la fenêtre principale (l'objet Tk)
     fenetre = canvas.master
     fenetre.title("BomberBUT")
 
     # Initialisation du jeu avec le canvas et la carte
-    jeu = Jeu(canvas, map_scenario)
+    jeu = Jeu(canvas, carte)
 
-    # Fonction pour gérer les touches
-    def on_key(event):
-        jeu.handle_key(event.keysym)
+    # Boucle de jeu à pas fixe : un tour tous les 1/TOURS_PAR_SECONDE s
+    boucle = Boucle(canvas, jeu.handle_key, TOURS_PAR_SECONDE, fini=lambda: jeu.fini)
 
-    # Liaison des touches
-    canvas.bind_all("<Key>", on_key)
+    # Les touches reçues par le canevas vont dans la file de la boucle
+    canvas.fileTouches = boucle.entrees
 
     # Boucle principale
+    boucle.demarrer()
     canvas.mainloop()
+    print(boucle.rapport())
+    enregistrer_replay(jeu, FICHIER_REPLAY)
 
 if __name__ == "__main__":
     main()
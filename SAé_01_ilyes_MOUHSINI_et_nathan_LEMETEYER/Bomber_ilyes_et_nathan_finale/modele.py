@@ -1,5 +1,10 @@
 import random
-from graphique import dessiner_map
+import hashlib
+from collections import deque, namedtuple
+from graphique import RenduTk, RenduNul
+from grille import Grille
+from fichiers_cartes import CarteCompilee
+from journal import Journal, journal_console
 
 
 
@@ -12,6 +17,25 @@ from graphique import dessiner_map
 
 TAILLE_CASE = 30  # Taille des cases en pixels (mis ici car l'importation depuis le fichier graphique ne marchait pas)
 
+# Codes des touches enregistrées pour les replays (une touche = un octet)
+CODES_TOUCHES = {None: 0, "Up": 1, "Down": 2, "Left": 3, "Right": 4, "space": 5}
+TOUCHES_CODES = {code: touche for touche, code in CODES_TOUCHES.items()}
+
+# Instantané de l'état d'une partie (voir Jeu.instantane / Jeu.restaurer).
+# Tous les champs sont immuables (bytes, tuples, nombres) : un instantané
+# peut être gardé et restauré autant de fois que voulu.
+Instantane = namedtuple("Instantane", [
+    "cases",        # bytes de la carte (un octet par case)
+    "compteurs",    # (tour, timer_global, fantome_timer, score, portée_explosion, nb_bombes_max,
+                    #  max_fantomes, duree_explosion, fini, nombre de touches jouées)
+    "bomber",       # (x, y, vie, niveau)
+    "fantomes",     # (x1, y1, x2, y2, ...) des fantômes vivants, dans l'ordre de déplacement
+    "bombes",       # ((x, y, portée, tours_avant_explosion, tour_explosion), ...)
+    "explosions",   # ((fin, ((x, y), ...)), ...) explosions encore affichées
+    "upgrades",     # tuple de Jeu.upgrades
+    "hasard",       # état du générateur aléatoire (rng.getstate())
+])
+
 
 # ===================================================================== #
 # ========================== CLASSES ================================== #
@@ -31,6 +55,7 @@ class Bomber:
         self.x = x
         self.y = y
         self.vie = 3  # Points de vie du Bomber
+        self.niveau = 0  # Nombre d'upgrades ramassés
 
     def mouvements(self, direction, game):
         """
@@ -61,13 +86,14 @@ class Fantome:
         """
         self.x = x
         self.y = y
+        self.vivant = True  # Passe à False quand le fantôme est détruit
 
     def move(self, game):
         """
         Déplace le Fantôme dans une direction aléatoire si la case cible est accessible.
         """
         directions = ["up", "down", "left", "right"]
-        random.shuffle(directions)
+        game.rng.shuffle(directions)
         for direction in directions:
             new_x, new_y = self.x, self.y
             if direction == "up":
@@ -85,22 +111,59 @@ class Fantome:
 # ============================= JEU ====================================
 
 class Jeu:
-    def __init__(self, canvas, map_data):
+    def __init__(self, canvas, map_data, rendu=None, journal=None, graine=None):
         """
         Initialise une instance de jeu avec le canevas graphique et la carte donnée.
+        :param canvas: Canevas tkiteasy, ou None pour jouer sans fenêtre.
+        :param map_data: La carte (liste de chaînes, Grille ou CarteCompilee).
+        :param rendu: Rendu à utiliser (par défaut RenduTk si un canevas est donné, RenduNul sinon).
+        :param journal: Journal des événements (par défaut la console avec une fenêtre, désactivé sans).
+        :param graine: Graine du hasard de la partie (tirée au hasard si None). Même carte,
+                       même graine et mêmes touches donnent exactement la même partie.
+                       Entier entre 0 et 2**64 - 1 (elle est enregistrée sur 64 bits dans les replays).
         """
         self.canvas = canvas
-        self.map_data = [list(row) for row in map_data]
-        self.bomber = self.trouve_bomber()
+        if rendu is None:
+            rendu = RenduTk(canvas, TAILLE_CASE) if canvas is not None else RenduNul()
+        self.rendu = rendu
+        if journal is None:
+            journal = journal_console() if canvas is not None else Journal(niveau=None)
+        self.journal = journal
+        self.fini = False  # Passe à True quand la partie est terminée
+        if graine is not None and not (isinstance(graine, int) and 0 <= graine < 2 ** 64):
+            raise ValueError(f"La graine doit être un entier entre 0 et 2**64 - 1, pas {graine!r}")
+        self.graine = graine if graine is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.graine)  # Hasard propre à la partie (fantômes)
+        self.touches_jouees = bytearray()  # Une touche (CODES_TOUCHES) par appel à handle_key
+        if isinstance(map_data, CarteCompilee):
+            # Carte déjà indexée par le chargeur (fichiers_cartes) : rien à analyser
+            self.map_data = map_data.grille.copie()
+            self.prises = list(map_data.prises)
+            self.colonnes = map_data.colonnes
+            self.murs_initiaux = map_data.murs
+            self.bomber = Bomber(*map_data.depart) if map_data.depart is not None else None
+        else:
+            # Copie de la carte dans une grille compacte (un octet par case)
+            self.map_data = map_data.copie() if isinstance(map_data, Grille) else Grille(map_data)
+            self.indexer_cases_statiques()
+            self.bomber = self.trouve_bomber()
+        self.carte_initiale = bytes(self.map_data.cases)  # Pour enregistrer un replay
         self.bomber.vie = 3  # Réinitialise la vie du Bomber
         self.niveau = 0  # Niveau initial
         self.fantomes = []
-        self.bombes = []  # Liste des bombes actives
+        self.fantomes_par_case = {}  # (x, y) -> Fantome, pour les recherches en O(1)
+        self.max_fantomes = 8  # Limite maximale de fantômes dans le jeu
+        self.bombes_par_case = {}  # (x, y) -> Bombe active, dans l'ordre de pose (voir Jeu.bombes)
+        self.echeancier = {}  # Tour d'explosion -> liste des bombes qui explosent à ce tour
         self.portée_explosion = 2  # Portée initiale des explosions
+        self.duree_explosion = 0  # Nombre de tours où les explosions restent affichées (0 = effacées aussitôt)
+        self.explosions = {}  # (x, y) -> tour où l'explosion de la case s'efface
+        self.expirations = deque()  # File des (tour de fin, cases) dans l'ordre des explosions
         self.nb_bombes_max = 1  # Nombre maximum de bombes posées simultanément
         self.upgrades = []  # Liste des upgrades sur la carte
         self.score = 0  # Score du Bomber
         self.timer_global = 500  # Durée totale du jeu en tours
+        self.cases_modifiees = set()  # Cases à redessiner à la fin du tour
         self.draw_map()
         self.tour = 0  # Compteur de tours
         self.fantome_timer = 10  # Intervalle en tours pour générer des fantômes
@@ -114,16 +177,18 @@ class Jeu:
         - Met à jour les bombes.
         - Vérifie les interactions.
         """
+        if self.fini:
+            return
+
         if self.bomber.vie <= 0:
-            print("Fin de la partie détectée dans tour_de_jeu (le bomber n'a plus de vie).")
+            self.journal.info(self.tour, "Fin de la partie détectée dans tour_de_jeu (le bomber n'a plus de vie).")
             self.fin_du_jeu()
             return
 
         # Timer global (le timer de la partie)
         self.timer_global -= 1
         if self.timer_global == 0:
-            print(f"Fin du jeu ! Score final : {self.score}")
-            self.canvas.fermerFenetre()
+            self.fin_du_jeu()
             return
 
         # Gestion du timer pour les fantômes
@@ -135,35 +200,54 @@ class Jeu:
             self.fantome_timer = 10  # Réinitialise le compteur
 
         # Actions des fantômes, bombes et autres interactions
+        self.clean_explosions()   # Efface les explosions terminées
         self.move_fantomes()      # Déplace les fantômes
         self.update_bombes()      # Met à jour les bombes
         self.ramasser_upgrade()   # Vérifie les upgrades ramassés
         self.attack_bomber()      # Vérifie les attaques des fantômes
+        self.rafraichir()         # Redessine les cases modifiées pendant le tour
         self.tour += 1
-        print(f"Tour : {self.tour}, Timer (nombre de tours restants) : {self.timer_global}")
+        self.journal.debug(self.tour, "Tour : {}, Timer (nombre de tours restants) : {}", self.tour, self.timer_global)
+
+
 
 
 
 
+    def indexer_cases_statiques(self):
+        """
+        Repère une fois pour toutes, au chargement de la carte, les cases qui ne bougent pas :
+        - self.prises : positions des prises Ethernet ('E'), qui génèrent les fantômes ;
+        - self.colonnes : masque des colonnes ('C'), 1 octet par case, jamais modifié ;
+        - self.murs_initiaux : masque des murs destructibles ('M') au début de la partie.
+        Une CarteCompilee (voir fichiers_cartes) contient déjà ces index.
+        """
+        self.prises = self.map_data.trouver("E")
+        self.colonnes = self.map_data.masque("C")
+        self.murs_initiaux = self.map_data.masque("M")
 
+    def est_colonne(self, x, y):
+        """
+        :return: True si la case (x, y) est une colonne indestructible.
+        """
+        return self.colonnes[y * self.map_data.largeur + x] == 1
 
     def trouve_bomber(self):
         """
         Trouve la position initiale du Bomber sur la carte.
         :return: Instance de Bomber si trouvée, sinon None.
         """
-        for y, row in enumerate(self.map_data):
-            for x, cell in enumerate(row):
-                if cell == "P":
-                    return Bomber(x, y)
-        return None
+        position = self.map_data.trouver_premier("P")
+        if position is None:
+            return None
+        return Bomber(*position)
 
     def non_bloquante(self, x, y):
         """
         Vérifie si une case est accessible pour le Bomber.
         :return: True si la case est accessible, False sinon.
         """
-        return 0 <= y < len(self.map_data) and 0 <= x < len(self.map_data[0]) and self.map_data[y][x] in [" ", "U"]
+        return self.map_data.dans(x, y) and self.map_data.lire(x, y) in " U"
 
     def update_map(self, old_x, old_y, new_x, new_y):
         """
@@ -173,60 +257,68 @@ class Jeu:
         :param new_x: Nouvelle position x du Bomber.
         :param new_y: Nouvelle position y du Bomber.
         """
-        self.map_data[old_y][old_x] = " "
-        self.map_data[new_y][new_x] = "P"
+        # Si le Bomber quitte la case de sa bombe, la bombe reste affichée
+        self.map_data.ecrire(old_x, old_y, "B" if (old_x, old_y) in self.bombes_par_case else " ")
+        self.map_data.ecrire(new_x, new_y, "P")
         self.update_case(old_x, old_y)
         self.update_case(new_x, new_y)
 
     def update_case(self, x, y):
         """
-        Met à jour visuellement une case spécifique.
+        Marque une case comme à redessiner. Le dessin est fait une seule fois
+        à la fin du tour par rafraichir(), même si la case change plusieurs fois.
+        """
+        self.cases_modifiees.add((x, y))
+
+    def rafraichir(self):
+        """
+        Envoie au rendu les cases modifiées depuis le dernier rafraîchissement, et les informations de la partie.
+        Ne fait rien une fois la partie finie : le rendu est alors fermé (fenêtre détruite).
         """
-        cell = self.map_data[y][x]
-        px, py = x * TAILLE_CASE, y * TAILLE_CASE
-        color = {
-            "C": "gray",    # Colonne indestructible
-            "M": "brown",   # Mur destructible
-            "E": "blue",    # Prise Ethernet
-            "P": "green",   # Bomber
-            "F": "red",     # Fantôme
-            "U": "yellow",  # Upgrade
-            "B": "white",   # Bombe
-            " ": "black",   # Case vide
-        }.get(cell, "black")
-        self.canvas.dessinerRectangle(px, py, TAILLE_CASE, TAILLE_CASE, color)
+        if self.fini:
+            self.cases_modifiees.clear()
+            return
+        for x, y in self.cases_modifiees:
+            self.rendu.dessiner_case(x, y, self.map_data.lire(x, y))
+        self.cases_modifiees.clear()
+        self.afficher_infos()
+
+    def afficher_infos(self):
+        self.rendu.afficher_infos(self.score, self.bomber.vie, self.timer_global, self.bomber.niveau)
 
 
     def draw_map(self):
-        dessiner_map(self.canvas, self.map_data, TAILLE_CASE)  # Passe les 3 arguments requis
+        self.rendu.dessiner_carte(self.map_data)
+        self.afficher_infos()
 
 
     def generate_fantomes(self):
         """
         Génère des fantômes autour de chaque prise Ethernet ('E'), avec une limite globale de fantômes.
         """
-        MAX_FANTOMES = 8  # Limite maximale de fantômes dans le jeu
-        if len(self.fantomes) >= MAX_FANTOMES:
+        if len(self.fantomes_par_case) >= self.max_fantomes:
             return  # Ne rien faire si la limite est atteinte
 
-        for y, row in enumerate(self.map_data):
-            for x, cell in enumerate(row):
-                if cell == "E":  # Trouve une prise Ethernet
-                    # Vérifie si on peut encore générer des fantômes
-                    if len(self.fantomes) >= MAX_FANTOMES:
-                        break
-
-                    directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-                    random.shuffle(directions)  # Mélange les directions
-                    for dx, dy in directions:
-                        nx, ny = x + dx, y + dy
-                        if self.non_bloquante_for_fantome(nx, ny):
-                            # Crée un nouveau fantôme
-                            self.fantomes.append(Fantome(nx, ny))
-                            self.map_data[ny][nx] = "F"  # Place le fantôme sur la carte
-                            self.update_case(nx, ny)    # Redessine la case
-                            print(f"Fantôme généré à ({nx}, {ny})")
-                            break  # Passe au générateur suivant
+        for x, y in self.prises:  # Prises Ethernet repérées au chargement
+            # Vérifie si on peut encore générer des fantômes
+            if len(self.fantomes_par_case) >= self.max_fantomes:
+                break
+            if self.map_data.lire(x, y) != "E":
+                continue  # Prise détruite par une explosion
+
+            directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+            self.rng.shuffle(directions)  # Mélange les directions
+            for dx, dy in directions:
+                nx, ny = x + dx, y + dy
+                if self.non_bloquante_for_fantome(nx, ny):
+                    # Crée un nouveau fantôme
+                    fantome = Fantome(nx, ny)
+                    self.fantomes.append(fantome)
+                    self.fantomes_par_case[(nx, ny)] = fantome
+                    self.map_data.ecrire(nx, ny, "F")  # Place le fantôme sur la carte
+                    self.update_case(nx, ny)    # Redessine la case
+                    self.journal.info(self.tour, "Fantôme généré à ({}, {})", nx, ny)
+                    break  # Passe au générateur suivant
 
 
 
@@ -237,18 +329,24 @@ class Jeu:
         :param y: Coordonnée y de la case.
         :return: True si la case est accessible, False sinon.
         """ 
-        return 0 <= y < len(self.map_data) and 0 <= x < len(self.map_data[0]) and self.map_data[y][x] == " "
+        return self.map_data.dans(x, y) and self.map_data.lire(x, y) == " "
 
     def move_fantomes(self):
         """
         Déplace tous les fantômes et met à jour leurs cases.
         """
+        # Les fantômes détruits depuis le tour précédent sont retirés ici, en une seule passe
+        if len(self.fantomes) != len(self.fantomes_par_case):
+            self.fantomes = [f for f in self.fantomes if f.vivant]
+
         for fantome in self.fantomes:
             old_x, old_y = fantome.x, fantome.y
             fantome.move(self)
             if (fantome.x, fantome.y) != (old_x, old_y):
-                self.map_data[old_y][old_x] = " "
-                self.map_data[fantome.y][fantome.x] = "F"
+                del self.fantomes_par_case[(old_x, old_y)]
+                self.fantomes_par_case[(fantome.x, fantome.y)] = fantome
+                self.map_data.ecrire(old_x, old_y, " ")
+                self.map_data.ecrire(fantome.x, fantome.y, "F")
                 self.update_case(old_x, old_y)
                 self.update_case(fantome.x, fantome.y)
 
@@ -258,12 +356,13 @@ class Jeu:
         Réduit les points de vie du Bomber si un Fantôme est adjacent (distance de Manhattan = 1).
         Si les points de vie du Bomber tombent à 0 ou moins, termine la partie.
         """
-        for fantome in self.fantomes:
-            if abs(fantome.x - self.bomber.x) + abs(fantome.y - self.bomber.y) == 1:
+        bx, by = self.bomber.x, self.bomber.y
+        for voisin in ((bx, by - 1), (bx, by + 1), (bx - 1, by), (bx + 1, by)):
+            if voisin in self.fantomes_par_case:
                 self.bomber.vie -= 1
-                print(f"Le Bomber a été attaqué ! Points de vie restants : {self.bomber.vie}")
+                self.journal.info(self.tour, "Le Bomber a été attaqué ! Points de vie restants : {}", self.bomber.vie)
                 if self.bomber.vie <= 0:
-                    print("Le Bomber a perdu toutes ses vies. Fin de la partie.")
+                    self.journal.info(self.tour, "Le Bomber a perdu toutes ses vies. Fin de la partie.")
                     self.fin_du_jeu()
                     return  # Stoppe l'exécution de cette méthode
 
@@ -272,7 +371,11 @@ class Jeu:
     def handle_key(self, key):
         """
         Gère les actions du joueur, puis passe au tour suivant.
+        :param key: Touche jouée (keysym Tk), ou None pour ne rien faire ce tour.
         """
+        if self.fini:
+            return
+        self.touches_jouees.append(CODES_TOUCHES.get(key, 0))
         if key == "Up":
             self.bomber.mouvements("up", self)
         elif key == "Down":
@@ -293,93 +396,165 @@ class Jeu:
         """
         Pose une bombe à la position du Bomber si possible.
         """
-        if len(self.bombes) < self.nb_bombes_max:
-            x, y = self.bomber.x, self.bomber.y
-            self.bombes.append(Bombe(x, y, self.portée_explosion, tours_avant_explosion=5))
-            self.map_data[y][x] = "B"  # Marque la bombe sur la carte
+        x, y = self.bomber.x, self.bomber.y
+        if len(self.bombes_par_case) < self.nb_bombes_max and (x, y) not in self.bombes_par_case:
+            bombe = Bombe(x, y, self.portée_explosion, tours_avant_explosion=5)
+            self.bombes_par_case[(x, y)] = bombe
+            self.programmer_bombe(bombe)
+            self.map_data.ecrire(x, y, "B")  # Marque la bombe sur la carte
             self.update_case(x, y)  # Redessine la case
 
 
+    def programmer_bombe(self, bombe):
+        """
+        Range une bombe dans l'échéancier, au tour où elle doit exploser.
+        La bombe posée au tour T avec un délai de N tours explose pendant le tour T + N - 1
+        (le tour de la pose compte comme le premier).
+        """
+        bombe.tour_explosion = self.tour + bombe.tours_avant_explosion - 1
+        self.echeancier.setdefault(bombe.tour_explosion, []).append(bombe)
+
+    @property
+    def bombes(self):
+        """
+        Bombes actives, dans l'ordre où elles ont été posées.
+        Vue sur bombes_par_case : une bombe qui explose en est retirée directement, sans
+        parcourir les autres.
+        """
+        return self.bombes_par_case.values()
+
+    def tours_restants(self, bombe):
+        """
+        :return: Nombre de tours (celui en cours compris) avant l'explosion de la bombe.
+        """
+        return bombe.tour_explosion - self.tour + 1
+
     def exploser_bombe(self, bombe):
         """
-        Gère l'explosion d'une bombe.
+        Gère l'explosion d'une bombe (et des bombes qu'elle fait exploser en chaîne).
         """
-        x, y = bombe.x, bombe.y
-        self.map_data[y][x] = " "  # Retire la bombe de la carte
-        self.update_case(x, y)
+        self.resoudre_explosions([bombe])
+
+    def resoudre_explosions(self, bombes):
+        """
+        Fait exploser un groupe de bombes et toutes celles qu'elles déclenchent en chaîne.
+        1. Calcul : une file de travail parcourt les bombes ; chaque rayon est calculé une
+           seule fois sur la carte du début de l'explosion, et les bombes touchées sont
+           ajoutées à la file (pas de récursion).
+        2. Application : les effets sur les cases, les fantômes et le Bomber sont appliqués
+           en une seule fois.
+        :param bombes: Bombes qui explosent ce tour-ci.
+        """
+        a_traiter = []
+        for bombe in bombes:
+            if not bombe.explosee:
+                bombe.explosee = True
+                self.bombes_par_case.pop((bombe.x, bombe.y), None)
+                a_traiter.append(bombe)
+
+        touchees = {}  # (x, y) -> contenu de la case qui arrête un rayon ("M", "F" ou "U")
+        cases_explosees = {}  # (x, y) -> None, cases traversées par les rayons (dans l'ordre)
+        coups_bomber = 0  # Nombre de rayons qui atteignent le Bomber
 
         directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # Haut, bas, gauche, droite
-        for dx, dy in directions:
-            for i in range(1, bombe.portée + 1):
-                nx, ny = x + dx * i, y + dy * i
-                if not (0 <= ny < len(self.map_data) and 0 <= nx < len(self.map_data[0])):
-                    break  # Hors de la carte
-
-                case = self.map_data[ny][nx]
-                if case == "C":  # Colonne indestructible bloque l'explosion
-                    break
-                elif case == "M":  # Mur destructible
-                    self.map_data[ny][nx] = " "  # Détruit le mur
-                    self.update_case(nx, ny)
-                    self.score += 1  # Le Bomber marque 1 point
-                    break
-                elif case == "F":  # Fantôme
-                    self.fantomes = [f for f in self.fantomes if not (f.x == nx and f.y == ny)]
-                    self.map_data[ny][nx] = "U"  # Place un upgrade
-                    self.update_case(nx, ny)
-                    print(f"Fantôme détruit à ({nx}, {ny}). Upgrade placé.")  # Débogage
-                    break
-
-                elif case == "P":  # Bomber
-                    self.bomber.vie -= 1
-                    print(f"Le Bomber a été touché ! Vie restante : {self.bomber.vie}")
-                    break
-                elif case == "U":  # Upgrade
-                    self.map_data[ny][nx] = " "  # Détruit l'upgrade
-                    self.update_case(nx, ny)
-                    break
-                elif case == "B":  # Autre bombe
-                    # Explosion en chaîne
-                    bombe_chainee = next((b for b in self.bombes if b.x == nx and b.y == ny), None)
-                    if bombe_chainee:
-                        self.exploser_bombe(bombe_chainee)
+        position_bomber = (self.bomber.x, self.bomber.y)
+        i = 0
+        while i < len(a_traiter):
+            bombe = a_traiter[i]
+            i += 1
+            x, y = bombe.x, bombe.y
+            for dx, dy in directions:
+                for k in range(1, bombe.portée + 1):
+                    nx, ny = x + dx * k, y + dy * k
+                    if not self.map_data.dans(nx, ny):
+                        break  # Hors de la carte
+
+                    if self.est_colonne(nx, ny):  # Colonne indestructible bloque l'explosion
+                        break
+
+                    case = self.map_data.lire(nx, ny)
+                    if case in "MFU":  # Mur, fantôme ou upgrade : touché, le rayon s'arrête
+                        touchees[(nx, ny)] = case
+                        break
 
-                # Marquer temporairement l'explosion
-                self.map_data[ny][nx] = "X"  # Explosion visible
-                self.update_case(nx, ny)
+                    # Explosion en chaîne : la bombe rejoint la file
+                    bombe_chainee = self.bombes_par_case.pop((nx, ny), None)
+                    if bombe_chainee:
+                        bombe_chainee.explosee = True
+                        a_traiter.append(bombe_chainee)
 
-        # Nettoyer les explosions après un tour
-        self.clean_explosions()
+                    # Bomber (la case affiche "B" s'il est resté sur sa bombe) : touché, le rayon s'arrête
+                    if (nx, ny) == position_bomber:
+                        coups_bomber += 1
+                        break
+                    cases_explosees[(nx, ny)] = None
+
+        # Retire les bombes de la carte (le Bomber peut être resté sur sa bombe)
+        for bombe in a_traiter:
+            x, y = bombe.x, bombe.y
+            self.map_data.ecrire(x, y, "P" if (x, y) == (self.bomber.x, self.bomber.y) else " ")
+            self.update_case(x, y)
+
+        for (nx, ny), case in touchees.items():
+            if case == "M":  # Mur destructible
+                self.map_data.ecrire(nx, ny, " ")  # Détruit le mur
+                self.score += 1  # Le Bomber marque 1 point
+            elif case == "F":  # Fantôme
+                fantome = self.fantomes_par_case.pop((nx, ny), None)
+                if fantome:
+                    fantome.vivant = False  # Retiré de self.fantomes au prochain déplacement
+                self.map_data.ecrire(nx, ny, "U")  # Place un upgrade
+                self.journal.info(self.tour, "Fantôme détruit à ({}, {}). Upgrade placé.", nx, ny)
+            else:  # Upgrade
+                self.map_data.ecrire(nx, ny, " ")  # Détruit l'upgrade
+            self.update_case(nx, ny)
+
+        for _ in range(coups_bomber):
+            self.bomber.vie -= 1
+            self.journal.info(self.tour, "Le Bomber a été touché ! Vie restante : {}", self.bomber.vie)
+
+        # Marquer temporairement l'explosion
+        fin = self.tour + self.duree_explosion
+        for nx, ny in cases_explosees:
+            self.map_data.ecrire(nx, ny, "X")  # Explosion visible
+            self.update_case(nx, ny)
+            self.explosions[(nx, ny)] = fin
+
+        # Les cases seront nettoyées quand l'explosion aura duré duree_explosion tours
+        self.expirations.append((fin, list(cases_explosees)))
+        if self.duree_explosion == 0:
+            self.clean_explosions()
 
 
 
 
     def clean_explosions(self):
         """
-        Supprime les marqueurs d'explosion ('X') après un tour.
-        """
-        for y, row in enumerate(self.map_data):
-            for x, cell in enumerate(row):
-                if cell == "X":
-                    self.map_data[y][x] = " "  # Remet la case à vide
-                    self.update_case(x, y)
+        Supprime les marqueurs d'explosion ('X') arrivés à expiration.
+        Seules les cases enregistrées par exploser_bombe sont visitées, pas toute la carte.
+        """
+        while self.expirations and self.expirations[0][0] <= self.tour:
+            fin, cases = self.expirations.popleft()
+            for case in cases:
+                # Une explosion plus récente sur la même case la prolonge
+                if self.explosions.get(case) == fin:
+                    del self.explosions[case]
+                    x, y = case
+                    if self.map_data.lire(x, y) == "X":
+                        self.map_data.ecrire(x, y, " ")  # Remet la case à vide
+                        self.update_case(x, y)
     
 
     
     def update_bombes(self):
         """
-        Met à jour les bombes, les fait exploser si leur délai est écoulé.
+        Fait exploser les bombes dont le délai est écoulé.
+        Seules les bombes prévues pour ce tour dans l'échéancier sont visitées ;
+        les autres bombes ne sont ni parcourues ni redessinées.
         """
-        bombes_restantes = []
-        for bombe in self.bombes:
-            if bombe.tick():
-                self.exploser_bombe(bombe)  # Explosion différée
-            else:
-                # Met à jour la carte pour s'assurer que la bombe reste visible
-                self.map_data[bombe.y][bombe.x] = "B"
-                self.update_case(bombe.x, bombe.y)
-                bombes_restantes.append(bombe)
-        self.bombes = bombes_restantes
+        bombes_dues = self.echeancier.pop(self.tour, None)
+        if bombes_dues:
+            self.resoudre_explosions(bombes_dues)  # Toutes les explosions du tour en une fois
 
 
 
@@ -389,7 +564,7 @@ class Jeu:
         Place un upgrade sur la carte.
         """
         self.upgrades.append((x, y, type_upgrade))
-        self.map_data[y][x] = "U"  # Marque l'upgrade sur la carte
+        self.map_data.ecrire(x, y, "U")  # Marque l'upgrade sur la carte
         self.update_case(x, y)
 
     def ramasser_upgrade(self):
@@ -398,29 +573,111 @@ class Jeu:
         """
 
         x, y = self.bomber.x, self.bomber.y
-        if self.map_data[y][x] == "U":  # Vérifie si la case contient un upgrade
-            self.map_data[y][x] = " "  # Supprime l'upgrade de la carte
+        if self.map_data.lire(x, y) == "U":  # Vérifie si la case contient un upgrade
+            self.map_data.ecrire(x, y, " ")  # Supprime l'upgrade de la carte
             self.update_case(x, y)  # Met à jour l'affichage
             self.bomber.niveau += 1  # Augmente le niveau du Bomber
             self.score += 3  # Le Bomber marque 3 points
-            print(f"Upgrade ramassé ! Niveau actuel : {self.bomber.niveau}, Score : {self.score}")
+            self.journal.info(self.tour, "Upgrade ramassé ! Niveau actuel : {}, Score : {}", self.bomber.niveau, self.score)
 
             # Applique les effets du niveau
             if self.bomber.niveau % 2 == 1:  # Niveau impair : +1 PV
                 self.bomber.vie += 1
-                print(f"Le Bomber gagne 1 PV. Vie actuelle : {self.bomber.vie}")
+                self.journal.info(self.tour, "Le Bomber gagne 1 PV. Vie actuelle : {}", self.bomber.vie)
             elif self.bomber.niveau % 2 == 0:  # Niveau pair : +1 portée
                 self.portée_explosion += 1
-                print(f"Portée augmentée. Portée actuelle : {self.portée_explosion}")
-
-
+                self.journal.info(self.tour, "Portée augmentée. Portée actuelle : {}", self.portée_explosion)
+
+
+
+    def empreinte(self):
+        """
+        Calcule une empreinte de l'état de la partie (carte, Bomber, fantômes, bombes, score, tours).
+        Deux parties dans le même état ont la même empreinte : sert à vérifier les replays.
+        :return: Empreinte hexadécimale (SHA-1).
+        """
+        h = hashlib.sha1(self.map_data.cases)
+        h.update(repr((
+            self.tour, self.timer_global, self.score, self.portée_explosion,
+            self.bomber.x, self.bomber.y, self.bomber.vie, self.bomber.niveau,
+            [(f.x, f.y) for f in self.fantomes if f.vivant],
+            [(b.x, b.y, b.portée, b.tour_explosion) for b in self.bombes],
+        )).encode())
+        return h.hexdigest()
+
+    def instantane(self):
+        """
+        Capture l'état complet de la partie (carte, entités, timers, score, hasard).
+        Sert aux IA qui simulent des coups à l'avance : instantane(), jouer, puis restaurer().
+        :return: Instantane immuable.
+        """
+        return Instantane(
+            bytes(self.map_data.cases),
+            (self.tour, self.timer_global, self.fantome_timer, self.score, self.portée_explosion,
+             self.nb_bombes_max, self.max_fantomes, self.duree_explosion, self.fini,
+             len(self.touches_jouees)),
+            (self.bomber.x, self.bomber.y, self.bomber.vie, self.bomber.niveau),
+            tuple(c for f in self.fantomes if f.vivant for c in (f.x, f.y)),
+            tuple((b.x, b.y, b.portée, b.tours_avant_explosion, b.tour_explosion) for b in self.bombes),
+            tuple((fin, tuple(c for c in cases if self.explosions.get(c) == fin))
+                  for fin, cases in self.expirations),
+            tuple(self.upgrades),
+            self.rng.getstate(),
+        )
+
+    def restaurer(self, instantane):
+        """
+        Remet la partie dans l'état d'un instantané pris sur cette carte.
+        Les index (fantômes, bombes, échéancier, explosions) sont reconstruits.
+        :param instantane: Instantane obtenu par instantane().
+        """
+        self.map_data.cases[:] = instantane.cases
+        (self.tour, self.timer_global, self.fantome_timer, self.score, self.portée_explosion,
+         self.nb_bombes_max, self.max_fantomes, self.duree_explosion, self.fini,
+         nb_touches) = instantane.compteurs
+        del self.touches_jouees[nb_touches:]
+        self.bomber.x, self.bomber.y, self.bomber.vie, self.bomber.niveau = instantane.bomber
+
+        positions = instantane.fantomes
+        self.fantomes = [Fantome(positions[i], positions[i + 1]) for i in range(0, len(positions), 2)]
+        self.fantomes_par_case = {(f.x, f.y): f for f in self.fantomes}
+
+        self.bombes_par_case = {}
+        self.echeancier = {}
+        for x, y, portée, tours_avant_explosion, tour_explosion in instantane.bombes:
+            bombe = Bombe(x, y, portée, tours_avant_explosion)
+            bombe.tour_explosion = tour_explosion
+            self.bombes_par_case[(x, y)] = bombe
+            self.echeancier.setdefault(tour_explosion, []).append(bombe)
+
+        self.expirations = deque((fin, list(cases)) for fin, cases in instantane.explosions)
+        self.explosions = {case: fin for fin, cases in instantane.explosions for case in cases}
+        self.upgrades = list(instantane.upgrades)
+        self.rng.setstate(instantane.hasard)
+
+        self.cases_modifiees.clear()
+        self.draw_map()  # Le rendu ne redessine que les cases qui ont changé
+
+    def copie(self):
+        """
+        :return: Nouvelle partie sans fenêtre ni journal, dans le même état que celle-ci.
+        """
+        carte = Grille.depuis_octets(self.map_data.largeur, self.map_data.hauteur, self.carte_initiale)
+        jeu = Jeu(None, carte, graine=self.graine)
+        jeu.touches_jouees = bytearray(self.touches_jouees)
+        jeu.restaurer(self.instantane())
+        return jeu
 
     def fin_du_jeu(self):
         """
         Gère la fin du jeu.
         """
-        print(f"Fin du jeu ! Score final : {self.score}")
-        self.canvas.fermerFenetre()
+        if self.fini:
+            return
+        self.fini = True
+        self.journal.alerte(self.tour, "Fin du jeu ! Score final : {}", self.score)
+        self.journal.fermer()
+        self.rendu.fermer()
 
 
 
@@ -431,14 +688,9 @@ class Bombe:
         self.x = x
         self.y = y
         self.portée = portée
-        self.tours_restants = tours_avant_explosion
-
-    def tick(self):
-        """
-        Réduit le nombre de tours restants avant l'explosion.
-        """
-        self.tours_restants -= 1
-        return self.tours_restants <= 0  # Retourne True si la bombe doit exploser
+        self.tours_avant_explosion = tours_avant_explosion
+        self.tour_explosion = None  # Fixé par Jeu.programmer_bombe quand la bombe est posée
+        self.explosee = False  # Passe à True quand la bombe a explosé (seule ou en chaîne)
     
 
 
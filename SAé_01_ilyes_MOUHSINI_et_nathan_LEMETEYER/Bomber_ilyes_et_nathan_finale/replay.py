@@ -0,0 +1,109 @@
+import sys
+import time
+import zlib
+import struct
+from collections import namedtuple
+from modele import Jeu, TOUCHES_CODES
+from grille import Grille
+
+
+#=====================================================
+#============== FICHIER REPLAY =======================
+#=====================================================
+
+# Enregistrement et relecture des parties. Une partie est entièrement
+# déterminée par la carte de départ, la graine du hasard et la suite des
+# touches jouées : c'est tout ce que contient un replay (plus l'empreinte de
+# l'état final pour vérifier la relecture). La relecture se fait sans
+# fenêtre, aussi vite que possible.
+#
+# Format du fichier : b"BBRP", un octet de version, puis zlib de
+#   graine (u64), largeur (u32), hauteur (u32), nombre de touches (u32),
+#   empreinte finale (20 octets), carte (largeur x hauteur octets), touches (1 octet chacune).
+# Les paramètres de la partie (portée, durée des explosions, ...) sont ceux par défaut de Jeu.
+
+
+MAGIQUE = b"BBRP"
+VERSION = 1
+ENTETE = struct.Struct("<QIII20s")
+
+Replay = namedtuple("Replay", ["graine", "carte", "touches", "empreinte"])
+
+
+def replay_de(jeu):
+    """
+    :return: Le Replay d'une partie (jouée depuis sa création, sans modification des paramètres).
+    """
+    largeur, hauteur = jeu.map_data.largeur, jeu.map_data.hauteur
+    carte = Grille.depuis_octets(largeur, hauteur, jeu.carte_initiale)
+    return Replay(jeu.graine, carte, bytes(jeu.touches_jouees), jeu.empreinte())
+
+
+def enregistrer_replay(jeu, chemin):
+    """
+    Écrit le replay d'une partie dans un fichier.
+    :param jeu: La partie à enregistrer.
+    :param chemin: Chemin du fichier replay.
+    """
+    replay = replay_de(jeu)
+    entete = ENTETE.pack(replay.graine, replay.carte.largeur, replay.carte.hauteur,
+                         len(replay.touches), bytes.fromhex(replay.empreinte))
+    donnees = zlib.compress(entete + bytes(replay.carte.cases) + replay.touches)
+    with open(chemin, "wb") as fichier:
+        fichier.write(MAGIQUE + bytes([VERSION]) + donnees)
+
+
+def charger_replay(chemin):
+    """
+    Lit un fichier replay.
+    :return: Le Replay lu.
+    """
+    with open(chemin, "rb") as fichier:
+        contenu = fichier.read()
+    if contenu[:4] != MAGIQUE or contenu[4] != VERSION:
+        raise ValueError(f"{chemin} n'est pas un replay BomberBUT (version {VERSION})")
+    donnees = zlib.decompress(contenu[5:])
+    graine, largeur, hauteur, nb_touches, empreinte = ENTETE.unpack_from(donnees)
+    debut = ENTETE.size
+    fin_carte = debut + largeur * hauteur
+    carte = Grille.depuis_octets(largeur, hauteur, donnees[debut:fin_carte])
+    touches = donnees[fin_carte:fin_carte + nb_touches]
+    return Replay(graine, carte, touches, empreinte.hex())
+
+
+def rejouer(replay, journal=None):
+    """
+    Rejoue un replay sans fenêtre, à pleine vitesse.
+    :param replay: Le Replay à rejouer.
+    :param journal: Journal des événements (désactivé par défaut), pour déboguer la partie.
+    :return: La partie (Jeu) dans son état final.
+    """
+    jeu = Jeu(None, replay.carte, journal=journal, graine=replay.graine)
+    for code in replay.touches:
+        jeu.handle_key(TOUCHES_CODES.get(code))
+    return jeu
+
+
+def verifier_replay(replay):
+    """
+    :return: True si la relecture aboutit exactement au même état final que la partie enregistrée.
+    """
+    return rejouer(replay).empreinte() == replay.empreinte
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Utilisation : python replay.py fichier_replay")
+        sys.exit(1)
+    replay = charger_replay(sys.argv[1])
+    debut = time.perf_counter()
+    jeu = rejouer(replay)
+    duree = time.perf_counter() - debut
+    ok = jeu.empreinte() == replay.empreinte
+    print(f"{len(replay.touches)} tours rejoués en {duree * 1000:.1f} ms, score {jeu.score}, "
+          f"empreinte {'identique' if ok else 'DIFFÉRENTE'}")
+    sys.exit(0 if ok else 2)
+
+#=====================================================
+#=====================================================
+#=====================================================
@@ -0,0 +1,73 @@
+import sys
+import time
+from modele import Jeu
+from cartes import map_scenario
+
+
+#=====================================================
+#============== FICHIER SIMULATION ===================
+#=====================================================
+
+# Fait tourner des parties sans fenêtre : le Jeu utilise un RenduNul et les
+# touches viennent d'un script ou d'une IA au lieu du clavier.
+
+
+def joueur_scripte(touches):
+    """
+    Crée un joueur qui rejoue une liste de touches, une par tour.
+    Quand la liste est épuisée, le joueur ne fait plus rien (None).
+    :param touches: Liste de touches ("Up", "Down", "Left", "Right", "space" ou None).
+    :return: Fonction joueur(jeu) -> touche.
+    """
+    touches = iter(touches)
+
+    def joueur(jeu):
+        return next(touches, None)
+
+    return joueur
+
+
+def simuler_partie(map_data, joueur=None, tours_max=None, journal=None, graine=None):
+    """
+    Joue une partie complète sans affichage.
+    :param map_data: La carte (liste de chaînes, Grille ou CarteCompilee).
+    :param joueur: Fonction joueur(jeu) -> touche appelée à chaque tour, ou None pour ne rien jouer.
+    :param tours_max: Nombre maximum de tours à jouer (None = jusqu'à la fin de la partie).
+    :param journal: Journal des événements (désactivé par défaut).
+    :param graine: Graine du hasard de la partie (voir Jeu).
+    :return: L'instance de Jeu à la fin de la simulation.
+    """
+    jeu = Jeu(None, map_data, journal=journal, graine=graine)
+    while not jeu.fini and (tours_max is None or jeu.tour < tours_max):
+        touche = joueur(jeu) if joueur is not None else None
+        jeu.handle_key(touche)
+    return jeu
+
+
+def simuler_parties(map_data, nb_parties, fabrique_joueur=None, tours_max=None):
+    """
+    Enchaîne plusieurs parties sans affichage.
+    :param map_data: La carte (liste de chaînes, Grille ou CarteCompilee).
+    :param nb_parties: Nombre de parties à jouer.
+    :param fabrique_joueur: Fonction sans argument qui crée un nouveau joueur pour chaque partie.
+    :param tours_max: Nombre maximum de tours par partie.
+    :return: Liste des scores finaux.
+    """
+    scores = []
+    for _ in range(nb_parties):
+        joueur = fabrique_joueur() if fabrique_joueur is not None else None
+        jeu = simuler_partie(map_data, joueur, tours_max)
+        scores.append(jeu.score)
+    return scores
+
+
+if __name__ == "__main__":
+    nb_parties = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    debut = time.perf_counter()
+    scores = simuler_parties(map_scenario, nb_parties)
+    duree = time.perf_counter() - debut
+    print(f"{nb_parties} parties en {duree:.2f} s ({nb_parties / duree:.0f} parties/s)")
+
+#=====================================================
+#=====================================================
+#=====================================================
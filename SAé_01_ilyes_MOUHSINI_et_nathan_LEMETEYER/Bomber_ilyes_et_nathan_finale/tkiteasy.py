@@ -2,6 +2,7 @@
 import tkinter as tk
 import tkinter.font as tkFont
 from time import sleep
+from collections import OrderedDict
 from PIL import ImageTk, Image
 
 
@@ -24,9 +25,15 @@ class Canevas(tk.Canvas):
         tk.Canvas.__init__(self, master, width=largeur, height=hauteur, bg="black", confine=True)
 # attributs
         self.master = master #la fenêtre hébergeant le canvas
-        self.img = {} #pour stocker les images sinon elles sont garbagecollectées dès leur création lol
+        self.images = OrderedDict() #cache LRU (fichier, taille) -> PhotoImage, garde aussi les images en vie (sinon garbagecollectées)
+        self.tailleCacheImages = 64 #nombre d'images gardées en cache (hors images affichées, jamais évincées)
+        self.utilisations = {} #(fichier, taille) -> nombre d'objets du canevas qui affichent l'image
+        self.imageDeObjet = {} #numéro d'objet -> (fichier, taille) de l'image qu'il affiche
+        self.atlas = {} #fichier -> {nom de tuile: PhotoImage} pour les planches de sprites
+        self.polices = {} #(famille, taille, graisse) -> tkFont.Font, une seule police par style
 #         self.obj = {}
         self.lastkey = None #dernière touche tapée
+        self.fileTouches = None #file optionnelle qui reçoit aussi les touches (voir entrees.py)
         self.lastclic = None #dernier clic cliqué
         self.lastpos = 0,0 #dernière pos souris
 
@@ -41,8 +48,16 @@ class Canevas(tk.Canvas):
 # CREATION D'OBJETS
 ################################################################################
 
+    def police(self, sizefont=18, famille='Helvetica', graisse='normal'):
+        cle = (famille, sizefont, graisse)
+        font = self.polices.get(cle)
+        if font is None:
+            font = tkFont.Font(family=famille, size=sizefont, weight=graisse)
+            self.polices[cle] = font
+        return font
+
     def afficherTexte(self, txt, x, y, col="white", sizefont=18):
-        font = tkFont.Font(family='Helvetica', size=sizefont, weight='normal')
+        font = self.police(sizefont)
         return ObjetGraphique(self.create_text(x,y,fill=col, text=txt, font=font), x, y, col)
 
     def dessinerRectangle(self, x, y, l, h, col):
@@ -60,15 +75,82 @@ class Canevas(tk.Canvas):
     def changerPixel(self, x, y, col):
         return ObjetGraphique(self.dessinerRectangle(x,y,1,1,col), x, y, col)
 
-    def afficherImage(self, x, y, filename):
+    def afficherImage(self, x, y, filename, taille=None):
+        cle = (filename, taille)
+        img = self.chargerImage(filename, taille)
+        if img is None:
+            return
+        num = self.create_image(x, y, image=img, anchor="nw")
+        self.utiliserImage(num, cle)
+        return ObjetGraphique(num, x, y, None)
+
+    def afficherTuile(self, x, y, filename, nom):
+        img = self.atlas[filename][nom]
+        return ObjetGraphique(self.create_image(x, y, image=img, anchor="nw"), x, y, None)
+
+################################################################################
+# CACHE D'IMAGES
+################################################################################
+# chaque fichier (et taille) n'est décodé qu'une fois, la même PhotoImage sert
+# à tous les objets qui l'affichent. Le cache garde au plus tailleCacheImages
+# images non affichées (les moins récemment utilisées partent en premier).
+# Une image affichée n'est jamais évincée : Tk effacerait l'objet.
+
+    def chargerImage(self, filename, taille=None):
+        cle = (filename, taille)
+        img = self.images.get(cle)
+        if img is not None:
+            self.images.move_to_end(cle)
+            return img
         image = Image.open(filename)
         if not image:
             print("Erreur: afficherImage",filename,": fichier incorrect")
             return
+        if taille is not None:
+            image = image.resize(taille)
         img = ImageTk.PhotoImage(image)
-        self.img[img] = True
-        self.create_rectangle(x, y, x+img.width()-1, y+img.height()-1, outline='')
-        return ObjetGraphique(self.create_image(x, y, image=img, anchor="nw"), x, y, None)
+        self.images[cle] = img
+        self.evincerImages()
+        return img
+
+    def evincerImages(self):
+        enTrop = len(self.images) - len(self.utilisations) - self.tailleCacheImages #les images affichées ne comptent pas
+        if enTrop <= 0:
+            return
+        for cle in list(self.images)[:-1]: #la dernière image chargée n'est jamais évincée tout de suite
+            if enTrop <= 0:
+                break
+            if not self.utilisations.get(cle):
+                del self.images[cle]
+                enTrop -= 1
+
+    def utiliserImage(self, num, cle):
+        ancienne = self.imageDeObjet.pop(num, None)
+        if ancienne is not None:
+            self.utilisations[ancienne] -= 1
+            if not self.utilisations[ancienne]:
+                del self.utilisations[ancienne]
+        if cle is not None:
+            self.imageDeObjet[num] = cle
+            self.utilisations[cle] = self.utilisations.get(cle, 0) + 1
+        self.evincerImages()
+
+    def chargerAtlas(self, filename, largeurTuile, hauteurTuile, noms=None):
+        #découpe une planche de sprites en tuiles (de gauche à droite puis de haut en bas),
+        #nommées par noms (liste) ou par leur numéro
+        image = Image.open(filename)
+        tuiles = {}
+        n = 0
+        for ty in range(image.height // hauteurTuile):
+            for tx in range(image.width // largeurTuile):
+                if noms is not None and n >= len(noms):
+                    break
+                nom = noms[n] if noms is not None else n
+                boite = (tx*largeurTuile, ty*hauteurTuile, (tx+1)*largeurTuile, (ty+1)*hauteurTuile)
+                tuiles[nom] = ImageTk.PhotoImage(image.crop(boite))
+                n += 1
+        self.atlas[filename] = tuiles
+        return tuiles
 
 ################################################################################
 # MODIFICATEURS
@@ -79,6 +161,7 @@ class Canevas(tk.Canvas):
         self.move(obj.num,x,y)
 
     def supprimer(self, obj):
+        self.utiliserImage(obj.num, None)
         self.delete(obj.num)
         obj = None
 
@@ -89,6 +172,17 @@ class Canevas(tk.Canvas):
     def changerTexte(self, obj, txt):
         self.itemconfigure(obj.num, text=txt)
 
+    def changerImage(self, obj, filename, taille=None):
+        img = self.chargerImage(filename, taille)
+        if img is None:
+            return
+        self.itemconfigure(obj.num, image=img)
+        self.utiliserImage(obj.num, (filename, taille))
+
+    def changerTuile(self, obj, filename, nom):
+        self.utiliserImage(obj.num, None)
+        self.itemconfigure(obj.num, image=self.atlas[filename][nom])
+
 ################################################################################
 # EVENEMENTS
 ################################################################################
@@ -106,6 +200,8 @@ class Canevas(tk.Canvas):
 #         if event.keysym != self.lastkey:
 #             print("Keyboard",event.keysym)#event, event.char)
             self.lastkey=event.keysym
+            if self.fileTouches is not None:
+                self.fileTouches.ajouter(event.keysym)
 
     def evenementDeplaceSouris(self, event):
 #         print("Move",event)#event, event.char)
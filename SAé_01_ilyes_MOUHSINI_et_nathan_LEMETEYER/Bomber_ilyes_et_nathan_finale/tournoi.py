@@ -0,0 +1,141 @@
+import os
+import sys
+import time
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from modele import Jeu
+from cartes import map_scenario
+from vue_ia import DOSSIER_IA, PiloteIA, charger_classe_ia, creer_ia
+
+
+#=====================================================
+#============== FICHIER TOURNOI ======================
+#=====================================================
+
+# Fait jouer l'IA sur beaucoup de parties sans fenêtre, réparties sur
+# plusieurs processus. Chaque processus charge l'IA une seule fois, puis
+# reçoit des lots de parties. Les graines des parties sont tirées à l'avance
+# à partir d'une graine de tournoi. Tout le hasard d'une partie vient du
+# générateur du Jeu (initialisé par cette graine) et l'IA est déterministe :
+# le résultat ne dépend pas de l'ordre dans lequel les processus terminent.
+
+
+_classe_ia = None  # Classe IA_Bomber chargée dans chaque processus
+
+
+def _initialiser_processus(dossier_ia):
+    global _classe_ia
+    _classe_ia = charger_classe_ia(dossier_ia)
+
+
+def jouer_match(num_carte, map_data, graine, tours_max=None):
+    """
+    Joue une partie de l'IA sur une carte.
+    :return: Dictionnaire du résultat (carte, graine, score, tour, vivant, latences).
+    """
+    jeu = Jeu(None, map_data, graine=graine)
+    pilote = PiloteIA(jeu, creer_ia(_classe_ia, jeu))
+    pilote.jouer_partie(tours_max)
+    return {"carte": num_carte, "graine": graine, "score": jeu.score, "tour": jeu.tour,
+            "vivant": jeu.bomber.vie > 0, "latences": pilote.latences}
+
+
+def jouer_lot(matchs, tours_max=None):
+    """
+    Joue un lot de parties dans un processus.
+    :param matchs: Liste de (num_carte, map_data, graine).
+    :return: Liste des résultats.
+    """
+    return [jouer_match(num_carte, map_data, graine, tours_max) for num_carte, map_data, graine in matchs]
+
+
+def percentile(valeurs_triees, p):
+    """
+    Percentile p (entre 0 et 100) d'une liste déjà triée, par le rang le plus proche.
+    """
+    if not valeurs_triees:
+        return 0.0
+    rang = min(len(valeurs_triees) - 1, int(p / 100 * len(valeurs_triees)))
+    return valeurs_triees[rang]
+
+
+class Resultats:
+    def __init__(self):
+        """
+        Agrège les résultats des parties au fur et à mesure qu'ils arrivent.
+        """
+        self.parties = 0
+        self.scores = []
+        self.tours = []
+        self.survivants = 0
+        self.latences = []
+
+    def ajouter(self, resultat):
+        self.parties += 1
+        self.scores.append(resultat["score"])
+        self.tours.append(resultat["tour"])
+        self.survivants += resultat["vivant"]
+        self.latences.extend(resultat["latences"])
+
+    def resume(self):
+        """
+        :return: Dictionnaire des statistiques (scores, tour de survie, latences de décision en µs).
+        """
+        if not self.parties:
+            return {"parties": 0}
+        latences = sorted(self.latences)
+        tours = sorted(self.tours)
+        return {
+            "parties": self.parties,
+            "score_moyen": sum(self.scores) / self.parties,
+            "score_max": max(self.scores),
+            "tour_moyen": sum(tours) / self.parties,
+            "tour_median": percentile(tours, 50),
+            "survivants": self.survivants,
+            "latence_p50_us": percentile(latences, 50) * 1e6,
+            "latence_p90_us": percentile(latences, 90) * 1e6,
+            "latence_p99_us": percentile(latences, 99) * 1e6,
+            "latence_max_us": (latences[-1] if latences else 0.0) * 1e6,
+        }
+
+
+def tournoi(cartes, nb_parties, graine=0, processus=None, lot=8, tours_max=None, dossier_ia=DOSSIER_IA):
+    """
+    Lance un tournoi et renvoie les résultats au fil de l'eau.
+    :param cartes: Liste des cartes (listes de chaînes) ; chaque carte est jouée nb_parties fois.
+    :param nb_parties: Nombre de parties par carte.
+    :param graine: Graine du tournoi, d'où sont tirées les graines des parties.
+    :param processus: Nombre de processus (None = nombre de cœurs).
+    :param lot: Nombre de parties envoyées à la fois à un processus.
+    :param tours_max: Nombre maximum de tours par partie.
+    :param dossier_ia: Dossier de l'IA à faire jouer.
+    :return: Générateur des résultats (voir jouer_match), dans l'ordre où ils arrivent.
+    """
+    hasard = random.Random(graine)
+    matchs = [(num_carte, carte, hasard.getrandbits(64))
+              for num_carte, carte in enumerate(cartes) for _ in range(nb_parties)]
+    lots = [matchs[i:i + lot] for i in range(0, len(matchs), lot)]
+    with ProcessPoolExecutor(max_workers=processus, initializer=_initialiser_processus,
+                             initargs=(dossier_ia,)) as executeur:
+        futurs = [executeur.submit(jouer_lot, matchs_lot, tours_max) for matchs_lot in lots]
+        for futur in as_completed(futurs):
+            yield from futur.result()
+
+
+if __name__ == "__main__":
+    nb_parties = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    processus = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    resultats = Resultats()
+    debut = time.perf_counter()
+    for resultat in tournoi([map_scenario], nb_parties, processus=processus):
+        resultats.ajouter(resultat)
+        if resultats.parties % 100 == 0:
+            print(f"{resultats.parties}/{nb_parties} parties")
+    duree = time.perf_counter() - debut
+    for cle, valeur in resultats.resume().items():
+        print(f"{cle}: {valeur:.1f}" if isinstance(valeur, float) else f"{cle}: {valeur}")
+    print(f"{nb_parties} parties en {duree:.2f} s avec {processus} processus ({nb_parties / duree:.0f} parties/s)")
+
+#=====================================================
+#=====================================================
+#=====================================================
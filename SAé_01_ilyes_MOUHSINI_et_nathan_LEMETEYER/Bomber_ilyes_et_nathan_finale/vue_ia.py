@@ -0,0 +1,236 @@
+import os
+import sys
+import time
+import importlib
+from itertools import islice
+from collections.abc import Mapping, Sequence
+
+
+#=====================================================
+#============== FICHIER VUE IA =======================
+#=====================================================
+
+# Pont entre le modèle (Jeu) et les IA (IA_Bomber). Les IA attendent un
+# game_dict {"map": ..., "bombers": [...], "bombes": [...]}. VueJeu présente
+# l'état vivant du Jeu sous cette forme sans rien recopier : la carte est lue
+# directement dans les octets de la Grille du jeu (par une memoryview en
+# lecture seule, l'IA ne peut pas modifier la partie), et les bombers et
+# bombes sont lus à la demande. La vue est créée une fois par partie et reste
+# valable à chaque tour.
+
+
+# Actions des IA -> touches comprises par Jeu.handle_key
+ACTIONS_TOUCHES = {"H": "Up", "B": "Down", "G": "Left", "D": "Right", "X": "space", "N": None}
+
+# Dossier de l'IA du projet (à côté du dossier de la SAé)
+DOSSIER_IA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "IA BomberBUT")
+MODULE_IA = "IA_MOUHSINI_ilyes_RHAZZOUL_saad"
+
+
+class VueBomber(Mapping):
+    """
+    Vue en lecture seule d'un Bomber : "position", "vie", "niveau".
+    """
+    def __init__(self, bomber):
+        self.bomber = bomber
+
+    def __getitem__(self, cle):
+        if cle == "position":
+            return self.bomber.x, self.bomber.y
+        if cle == "vie":
+            return self.bomber.vie
+        if cle == "niveau":
+            return self.bomber.niveau
+        raise KeyError(cle)
+
+    def __iter__(self):
+        return iter(("position", "vie", "niveau"))
+
+    def __len__(self):
+        return 3
+
+
+class VueBombe(Mapping):
+    """
+    Vue en lecture seule d'une bombe : "position", "portée", "timer" (tours avant explosion, 1 = ce tour-ci).
+    """
+    def __init__(self, jeu, bombe):
+        self.jeu = jeu
+        self.bombe = bombe
+
+    def __getitem__(self, cle):
+        if cle == "position":
+            return self.bombe.x, self.bombe.y
+        if cle == "portée":
+            return self.bombe.portée
+        if cle == "timer":
+            return self.jeu.tours_restants(self.bombe)
+        raise KeyError(cle)
+
+    def __iter__(self):
+        return iter(("position", "portée", "timer"))
+
+    def __len__(self):
+        return 3
+
+
+class VueLigne(Sequence):
+    """
+    Vue en lecture seule d'une ligne de la carte : vue[x] donne le caractère de la case.
+    """
+    def __init__(self, cases, debut, largeur):
+        self.cases = cases
+        self.debut = debut
+        self.largeur = largeur
+
+    def __len__(self):
+        return self.largeur
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return str(self)[x]
+        if x < 0:
+            x += self.largeur
+        if not 0 <= x < self.largeur:
+            raise IndexError(x)
+        return chr(self.cases[self.debut + x])
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __str__(self):
+        return str(self.cases[self.debut:self.debut + self.largeur], "ascii")
+
+
+class VueCarte(Sequence):
+    """
+    Vue en lecture seule de la carte du jeu, sans copie : vue[y][x] comme une liste de chaînes.
+    cases est une memoryview en lecture seule des octets de la Grille (un octet par case).
+    """
+    def __init__(self, grille):
+        self.largeur, self.hauteur = grille.largeur, grille.hauteur
+        self.cases = memoryview(grille.cases).toreadonly()
+        self.lignes = tuple(VueLigne(self.cases, y * self.largeur, self.largeur)
+                            for y in range(self.hauteur))  # Créées une seule fois
+
+    def __len__(self):
+        return self.hauteur
+
+    def __getitem__(self, y):
+        return self.lignes[y]
+
+    def __iter__(self):
+        return iter(self.lignes)
+
+
+class VueBombes(Sequence):
+    """
+    Vue en lecture seule de la liste des bombes actives du jeu.
+    """
+    def __init__(self, jeu):
+        self.jeu = jeu
+
+    def __getitem__(self, i):
+        bombes = self.jeu.bombes
+        if isinstance(i, slice):
+            return [VueBombe(self.jeu, bombe) for bombe in list(bombes)[i]]
+        n = len(bombes)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        return VueBombe(self.jeu, next(islice(bombes, i, None)))  # Sans recopier la liste des bombes
+
+    def __len__(self):
+        return len(self.jeu.bombes)
+
+    def __iter__(self):
+        jeu = self.jeu
+        for bombe in jeu.bombes:
+            yield VueBombe(jeu, bombe)
+
+
+class VueJeu(Mapping):
+    """
+    game_dict en lecture seule sur un Jeu vivant.
+    """
+    def __init__(self, jeu):
+        self.jeu = jeu
+        self.bombers = (VueBomber(jeu.bomber),)  # Le Jeu n'a qu'un Bomber (joueur 0)
+        self.bombes = VueBombes(jeu)
+        self.carte = VueCarte(jeu.map_data)
+
+    def __getitem__(self, cle):
+        if cle == "map":
+            return self.carte
+        if cle == "bombers":
+            return self.bombers
+        if cle == "bombes":
+            return self.bombes
+        raise KeyError(cle)
+
+    def __iter__(self):
+        return iter(("map", "bombers", "bombes"))
+
+    def __len__(self):
+        return 3
+
+
+class PiloteIA:
+    def __init__(self, jeu, ia):
+        """
+        Branche une IA sur une partie.
+        :param jeu: La partie (Jeu), en général sans fenêtre.
+        :param ia: L'IA (objet avec num_joueur et action(game_dict)). Le Jeu n'a qu'un Bomber :
+                   l'IA doit piloter le Bomber 0.
+        """
+        if isinstance(ia, (list, tuple)):
+            raise TypeError("PiloteIA pilote une seule IA : le Jeu n'a qu'un Bomber")
+        self.jeu = jeu
+        self.vue = VueJeu(jeu)
+        if not 0 <= ia.num_joueur < len(self.vue.bombers):
+            raise ValueError(f"Pas de Bomber numéro {ia.num_joueur} dans ce jeu "
+                             f"({len(self.vue.bombers)} Bomber(s))")
+        self.ia = ia
+        self.latences = []  # Durée de chaque décision de l'IA, en secondes
+
+    def jouer_tour(self):
+        """
+        Demande son action à l'IA puis joue le tour.
+        """
+        debut = time.perf_counter()
+        action = self.ia.action(self.vue)
+        self.latences.append(time.perf_counter() - debut)
+        self.jeu.handle_key(ACTIONS_TOUCHES.get(action))
+
+    def jouer_partie(self, tours_max=None):
+        """
+        Joue jusqu'à la fin de la partie (ou tours_max tours).
+        :return: La partie (Jeu).
+        """
+        while not self.jeu.fini and (tours_max is None or self.jeu.tour < tours_max):
+            self.jouer_tour()
+        return self.jeu
+
+
+def charger_classe_ia(dossier=DOSSIER_IA, module=MODULE_IA):
+    """
+    Importe la classe IA_Bomber depuis son dossier.
+    :return: La classe IA_Bomber.
+    """
+    dossier = os.path.abspath(dossier)
+    if dossier not in sys.path:
+        sys.path.insert(0, dossier)  # L'IA importe ses propres modules (chemins, distances, danger)
+    return importlib.import_module(module).IA_Bomber
+
+
+def creer_ia(classe_ia, jeu, num_joueur=0):
+    """
+    Crée une IA pour une partie, avec les paramètres attendus par IA_Bomber.
+    """
+    return classe_ia(num_joueur, VueJeu(jeu), jeu.timer_global, jeu.fantome_timer)
+
+
+#=====================================================
+#=====================================================
+#=====================================================